@@ -1,11 +1,46 @@
-"""Unified cache service for LLM results, collections, and other data."""
+"""Unified cache service for LLM results, collections, and other data.
+
+Entries live in a single SQLite database (cache/cache.db) keyed by
+(cache_type, key), so a lookup or update touches one row instead of
+re-reading and rewriting a whole JSON file. Legacy cache/<type>.json
+files are imported on first use and renamed to <type>.json.migrated.
+"""
 
 import json
+import sqlite3
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
+
+from .json_utils import dumps, loads
 
 CACHE_DIR = Path("cache")
+DB_FILENAME = "cache.db"
+
+# One connection is shared by all threads (batch enrichment, TUI workers);
+# the lock serializes access to it.
+_lock = threading.RLock()
+_conn: Optional[sqlite3.Connection] = None
+
+# In-process memo of raw rows: (cache_type, key) -> (value, timestamp, ttl_days).
+# Our own writes update it; writes by other processes bump PRAGMA data_version,
+# which drops it. Raw JSON text is kept (not decoded values) so callers still
+# get a fresh object they can mutate.
+_MEMO_MAX_ENTRIES = 1024
+_memo: dict[tuple[str, str], tuple[str, Optional[str], Optional[float]]] = {}
+_memo_data_version: Optional[int] = None
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cache (
+    cache_type TEXT NOT NULL,
+    key TEXT NOT NULL,
+    value TEXT NOT NULL,
+    timestamp TEXT,
+    ttl_days REAL,
+    PRIMARY KEY (cache_type, key)
+)
+"""
 
 
 def _ensure_cache_dir():
@@ -13,42 +48,67 @@ def _ensure_cache_dir():
     CACHE_DIR.mkdir(exist_ok=True)
 
 
-def _get_cache_path(cache_type: str) -> Path:
-    """Get cache file path for a given cache type.
-
-    Args:
-        cache_type: Type of cache (e.g., 'llm', 'collections')
-
-    Returns:
-        Path to cache file
-    """
-    return CACHE_DIR / f"{cache_type}.json"
-
-
-def _load_cache_file(cache_type: str) -> dict:
-    """Load entire cache file for a given type.
-
-    Returns:
-        Dict with cache data, or empty dict if file doesn't exist
-    """
-    cache_path = _get_cache_path(cache_type)
-    if not cache_path.exists():
-        return {}
-
-    try:
-        return json.loads(cache_path.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
-        return {}
-
-
-def _save_cache_file(cache_type: str, data: dict) -> None:
-    """Save entire cache file for a given type."""
-    _ensure_cache_dir()
-    cache_path = _get_cache_path(cache_type)
-    cache_path.write_text(
-        json.dumps(data, ensure_ascii=False, indent=2),
-        encoding="utf-8"
-    )
+def _get_conn() -> sqlite3.Connection:
+    """Open the cache database on first use (caller must hold _lock)."""
+    global _conn
+    if _conn is None:
+        _ensure_cache_dir()
+        conn = sqlite3.connect(CACHE_DIR / DB_FILENAME, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(_SCHEMA)
+        conn.commit()
+        _migrate_json_files(conn)
+        _conn = conn
+    return _conn
+
+
+def _migrate_json_files(conn: sqlite3.Connection) -> None:
+    """Import legacy per-type JSON cache files into the database (one-time)."""
+    for path in sorted(CACHE_DIR.glob("*.json")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            continue
+        if not isinstance(data, dict):
+            continue
+
+        rows = []
+        for key, entry in data.items():
+            # Entries with TTL were wrapped: {"timestamp": ..., "value": ...}
+            if isinstance(entry, dict) and "value" in entry:
+                rows.append((path.stem, key, json.dumps(entry["value"], ensure_ascii=False),
+                             entry.get("timestamp"), entry.get("ttl_days")))
+            else:
+                rows.append((path.stem, key, json.dumps(entry, ensure_ascii=False), None, None))
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO cache (cache_type, key, value, timestamp, ttl_days) VALUES (?, ?, ?, ?, ?)",
+                rows,
+            )
+        path.rename(path.with_name(path.name + ".migrated"))
+
+
+def _effective_max_age(max_age_days: Optional[float], entry_ttl_days: Optional[float]) -> Optional[float]:
+    """Return the stricter of the caller's max age and the TTL stored with the entry."""
+    ages = [a for a in (max_age_days, entry_ttl_days) if isinstance(a, (int, float))]
+    return min(ages) if ages else None
+
+
+def _sync_memo(conn: sqlite3.Connection) -> None:
+    """Drop the memo if another connection has committed since we last looked (caller holds _lock)."""
+    global _memo_data_version
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    if data_version != _memo_data_version:
+        _memo.clear()
+        _memo_data_version = data_version
+
+
+def _memo_put(memo_key: tuple[str, str], row: tuple[str, Optional[str], Optional[float]]) -> None:
+    """Store a row in the memo, starting over when it grows too large (caller holds _lock)."""
+    if len(_memo) >= _MEMO_MAX_ENTRIES:
+        _memo.clear()
+    _memo[memo_key] = row
 
 
 def get_cache(key: str, cache_type: str, max_age_days: Optional[int] = None) -> Optional[Any]:
@@ -58,57 +118,98 @@ def get_cache(key: str, cache_type: str, max_age_days: Optional[int] = None) ->
         key: Cache key (e.g., URL for LLM, or 'data' for collections)
         cache_type: Type of cache (e.g., 'llm', 'collections')
         max_age_days: Maximum age in days. If provided, check timestamp and invalidate if too old.
+            Entries stored with their own ttl_days also expire after that TTL.
 
     Returns:
         Cached value or None if not found/expired
     """
-    cache_data = _load_cache_file(cache_type)
-
-    if key not in cache_data:
-        return None
-
-    entry = cache_data[key]
-
-    # Check expiration if max_age_days is set
-    if max_age_days is not None and isinstance(entry, dict) and "timestamp" in entry:
-        try:
-            cached_time = datetime.fromisoformat(entry["timestamp"])
-            if datetime.now() - cached_time > timedelta(days=max_age_days):
-                # Expired, remove it
-                del cache_data[key]
-                _save_cache_file(cache_type, cache_data)
+    memo_key = (cache_type, key)
+    with _lock:
+        conn = _get_conn()
+        _sync_memo(conn)
+        row = _memo.get(memo_key)
+        if row is None:
+            row = conn.execute(
+                "SELECT value, timestamp, ttl_days FROM cache WHERE cache_type = ? AND key = ?",
+                (cache_type, key),
+            ).fetchone()
+            if row is None:
                 return None
-        except (ValueError, KeyError):
-            pass
+            _memo_put(memo_key, row)
+
+        value, timestamp, ttl_days = row
+
+        # Check expiration against max_age_days and the entry's own TTL, whichever is shorter
+        max_age = _effective_max_age(max_age_days, ttl_days) if timestamp else None
+        if max_age is not None:
+            try:
+                cached_time = datetime.fromisoformat(timestamp)
+                if datetime.now() - cached_time > timedelta(days=max_age):
+                    # Expired, remove it
+                    _memo.pop(memo_key, None)
+                    with conn:
+                        conn.execute("DELETE FROM cache WHERE cache_type = ? AND key = ?", (cache_type, key))
+                    return None
+            except ValueError:
+                pass
 
-    # Return the value (for timestamped entries, return the 'value' field)
-    if isinstance(entry, dict) and "value" in entry:
-        return entry["value"]
-    return entry
+    try:
+        return loads(value)
+    except ValueError:
+        return None
 
 
-def set_cache(key: str, value: Any, cache_type: str, ttl_days: Optional[int] = None) -> None:
+def set_cache(key: str, value: Any, cache_type: str, ttl_days: Optional[float] = None) -> None:
     """Set cache value with optional TTL.
 
     Args:
         key: Cache key
         value: Value to cache
         cache_type: Type of cache
-        ttl_days: Time-to-live in days. If provided, adds timestamp for expiration checking.
+        ttl_days: Time-to-live in days. If provided, adds timestamp for expiration checking;
+            get_cache() honors it even when the reader passes a longer max_age_days.
     """
-    cache_data = _load_cache_file(cache_type)
+    # Store a timestamp only for TTL entries, as before
+    timestamp = datetime.now().isoformat() if ttl_days is not None else None
+    encoded = dumps(value)
+    with _lock:
+        conn = _get_conn()
+        _sync_memo(conn)
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (cache_type, key, value, timestamp, ttl_days) VALUES (?, ?, ?, ?, ?)",
+                (cache_type, key, encoded, timestamp, ttl_days),
+            )
+        _memo_put((cache_type, key), (encoded, timestamp, ttl_days))
+
+
+def update_cache_value(key: str, value: Any, cache_type: str) -> bool:
+    """Replace the value of an existing entry, keeping its timestamp and TTL.
 
-    if ttl_days is not None:
-        # Store with timestamp for TTL
-        cache_data[key] = {
-            "timestamp": datetime.now().isoformat(),
-            "value": value
-        }
-    else:
-        # Store value directly
-        cache_data[key] = value
+    For refreshing part of an entry without extending its expiry.
 
-    _save_cache_file(cache_type, cache_data)
+    Args:
+        key: Cache key
+        value: New value
+        cache_type: Type of cache
+
+    Returns:
+        True if the entry existed and was updated
+    """
+    encoded = dumps(value)
+    memo_key = (cache_type, key)
+    with _lock:
+        conn = _get_conn()
+        _sync_memo(conn)
+        with conn:
+            updated = conn.execute(
+                "UPDATE cache SET value = ? WHERE cache_type = ? AND key = ?",
+                (encoded, cache_type, key),
+            ).rowcount
+        row = _memo.pop(memo_key, None)
+        if updated and row is not None:
+            _memo_put(memo_key, (encoded, row[1], row[2]))
+    return bool(updated)
 
 
 def remove_cache(key: str, cache_type: str) -> None:
@@ -118,10 +219,30 @@ def remove_cache(key: str, cache_type: str) -> None:
         key: Cache key to remove
         cache_type: Type of cache
     """
-    cache_data = _load_cache_file(cache_type)
-    if key in cache_data:
-        del cache_data[key]
-        _save_cache_file(cache_type, cache_data)
+    with _lock:
+        conn = _get_conn()
+        _memo.pop((cache_type, key), None)
+        with conn:
+            conn.execute("DELETE FROM cache WHERE cache_type = ? AND key = ?", (cache_type, key))
+
+
+def remove_cache_many(keys: Iterable[str], cache_type: str) -> None:
+    """Remove several cache entries in a single transaction.
+
+    Args:
+        keys: Cache keys to remove
+        cache_type: Type of cache
+    """
+    keys = list(keys)
+    with _lock:
+        conn = _get_conn()
+        for key in keys:
+            _memo.pop((cache_type, key), None)
+        with conn:
+            conn.executemany(
+                "DELETE FROM cache WHERE cache_type = ? AND key = ?",
+                [(cache_type, key) for key in keys],
+            )
 
 
 def clear_cache_type(cache_type: str) -> None:
@@ -130,6 +251,40 @@ def clear_cache_type(cache_type: str) -> None:
     Args:
         cache_type: Type of cache to clear
     """
-    cache_path = _get_cache_path(cache_type)
-    if cache_path.exists():
-        cache_path.unlink()
+    with _lock:
+        conn = _get_conn()
+        for memo_key in [k for k in _memo if k[0] == cache_type]:
+            del _memo[memo_key]
+        with conn:
+            conn.execute("DELETE FROM cache WHERE cache_type = ?", (cache_type,))
+
+
+def get_cache_keys(cache_type: str) -> set[str]:
+    """Return all stored keys for a cache type (expired entries not yet purged included).
+
+    Args:
+        cache_type: Type of cache
+
+    Returns:
+        Set of cache keys
+    """
+    with _lock:
+        conn = _get_conn()
+        rows = conn.execute("SELECT key FROM cache WHERE cache_type = ?", (cache_type,)).fetchall()
+    return {key for (key,) in rows}
+
+
+def iter_cache_items(cache_type: str) -> Iterator[tuple[str, Any]]:
+    """Yield (key, value) pairs for a cache type (expired entries not yet purged included).
+
+    Args:
+        cache_type: Type of cache
+    """
+    with _lock:
+        conn = _get_conn()
+        rows = conn.execute("SELECT key, value FROM cache WHERE cache_type = ?", (cache_type,)).fetchall()
+    for key, value in rows:
+        try:
+            yield key, loads(value)
+        except ValueError:
+            continue
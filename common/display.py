@@ -1,10 +1,17 @@
 """Display and formatting utilities."""
 
-import difflib
 import hashlib
+import os
+import re
+from functools import lru_cache
 from rich.console import Console
 from rich.text import Text
 
+try:
+    from cdifflib import CSequenceMatcher as SequenceMatcher
+except ImportError:
+    from difflib import SequenceMatcher
+
 console = Console(highlight=False)
 
 # Colors for tags (visually distinct, readable on dark backgrounds)
@@ -15,8 +22,9 @@ TAG_COLORS = [
 ]
 
 
+@lru_cache(maxsize=1024)
 def get_tag_color(tag_name: str) -> str:
-    """Get a consistent color for a tag based on its name."""
+    """Get a consistent color for a tag based on its name (memoized: tags repeat across links)."""
     tag_hash = int(hashlib.md5(tag_name.encode()).hexdigest(), 16)
     return TAG_COLORS[tag_hash % len(TAG_COLORS)]
 
@@ -28,10 +36,68 @@ def format_tags_display(tags: list[str]) -> str:
     )
 
 
+# Diff units: runs of word characters, or a single other character
+# (space, slash, punctuation)
+_DIFF_TOKEN_RE = re.compile(r"\w+|\W")
+# Two word characters in a row: a cut between them would split a token
+_WORD_PAIR_RE = re.compile(r"\w\w")
+
+
+def _token_offsets(tokens: list[str], start: int) -> list[int]:
+    """Character offset of each token boundary (len(tokens) + 1 entries)."""
+    offsets = [start]
+    for token in tokens:
+        offsets.append(offsets[-1] + len(token))
+    return offsets
+
+
+def _in_word(text: str, pos: int) -> bool:
+    """Whether a cut at pos falls inside a run of word characters."""
+    return 0 < pos < len(text) and _WORD_PAIR_RE.match(text, pos - 1) is not None
+
+
+def _diff_opcodes(old: str, new: str) -> list[tuple[str, int, int, int, int]]:
+    """SequenceMatcher opcodes for old -> new, matching only the differing middle.
+
+    Edits usually touch a small part of a title/description/URL: the common
+    prefix and suffix are found with C-level string comparisons, so the
+    (quadratic) matcher only sees what actually changed. The trim stops at
+    token boundaries and the middle is compared word by word rather than
+    character by character: far fewer elements, and highlights that don't
+    split words apart.
+    """
+    if old == new:
+        return [("equal", 0, len(old), 0, len(new))] if old else []
+
+    prefix = len(os.path.commonprefix([old, new]))
+    # Cut only between tokens: back off while the cut would split a word in either string
+    while _in_word(old, prefix) or _in_word(new, prefix):
+        prefix -= 1
+    # Suffix of what follows the prefix, so the two can't overlap
+    suffix = len(os.path.commonprefix([old[prefix:][::-1], new[prefix:][::-1]]))
+    old_end, new_end = len(old) - suffix, len(new) - suffix
+    while _in_word(old, old_end) or _in_word(new, new_end):
+        suffix -= 1
+        old_end += 1
+        new_end += 1
+
+    opcodes = [("equal", 0, prefix, 0, prefix)] if prefix else []
+    old_tokens = _DIFF_TOKEN_RE.findall(old, prefix, old_end)
+    new_tokens = _DIFF_TOKEN_RE.findall(new, prefix, new_end)
+    old_at = _token_offsets(old_tokens, prefix)
+    new_at = _token_offsets(new_tokens, prefix)
+    # No autojunk: on 200+ tokens it would ignore frequent ones ("/", " ", "-")
+    # and highlight text that didn't change
+    matcher = SequenceMatcher(None, old_tokens, new_tokens, autojunk=False)
+    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+        opcodes.append((tag, old_at[i1], old_at[i2], new_at[j1], new_at[j2]))
+    if suffix:
+        opcodes.append(("equal", old_end, len(old), new_end, len(new)))
+    return opcodes
+
+
 def show_diff(old: str, new: str, indent: str = "      ", muted: bool = False, label: str = "") -> None:
     """Show diff with highlighted changes using rich."""
-    matcher = difflib.SequenceMatcher(None, old, new)
-
     if muted:
         old_style, new_style = "dim red", "dim green"
         old_hl, new_hl = "red", "green"
@@ -50,7 +116,7 @@ def show_diff(old: str, new: str, indent: str = "      ", muted: bool = False, l
     if label:
         new_text.append(f"{label}: ", style=new_style)
 
-    for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+    for tag, i1, i2, j1, j2 in _diff_opcodes(old, new):
         if tag == "equal":
             old_text.append(old[i1:i2], style=eq_style)
             new_text.append(new[j1:j2], style=eq_style)
@@ -3,10 +3,22 @@ Shared utilities and exceptions for content fetchers.
 """
 
 import math
-from typing import Tuple
-from urllib.parse import urlparse
+import re
+import socket
+import threading
+import time
+from functools import lru_cache
+from typing import Optional, Tuple
+from urllib.parse import parse_qs, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.connection import allowed_gai_family
+
+from .cache import get_cache, set_cache
 
 
 class ContentFetchError(Exception):
@@ -19,6 +31,21 @@ class RateLimitError(ContentFetchError):
     pass
 
 
+# Sentence endings: . ! ? followed by space or newline
+_SENTENCE_END_RE = re.compile(r"[.!?][ \n]")
+# For long limits, look for a boundary in this many trailing chars first
+_TAIL_WINDOW = 256
+_TAIL_WINDOW_MIN_CHARS = 4096
+
+
+def _last_sentence_end(text: str, start: int) -> int:
+    """Return index of the whitespace after the last sentence ending at/after start, or -1."""
+    last_boundary = -1
+    for match in _SENTENCE_END_RE.finditer(text, start):
+        last_boundary = match.end() - 1  # Keep the punctuation
+    return last_boundary
+
+
 def truncate_content(text: str, max_chars: int) -> Tuple[str, bool]:
     """
     Intelligently truncate text at sentence boundaries.
@@ -36,14 +63,14 @@ def truncate_content(text: str, max_chars: int) -> Tuple[str, bool]:
     # Find last sentence boundary before max_chars
     truncated = text[:max_chars]
 
-    # Look for sentence endings: . ! ? followed by space or end
-    sentence_endings = ['. ', '! ', '? ', '.\n', '!\n', '?\n']
+    # Look for sentence endings: . ! ? followed by space or newline.
+    # Boundaries in the first half are rejected below, so don't scan them.
+    # Long texts almost always have one near the end: try the tail window first.
     last_boundary = -1
-
-    for ending in sentence_endings:
-        pos = truncated.rfind(ending)
-        if pos > last_boundary:
-            last_boundary = pos + len(ending) - 1  # Keep the punctuation
+    if max_chars > _TAIL_WINDOW_MIN_CHARS:
+        last_boundary = _last_sentence_end(truncated, max_chars - _TAIL_WINDOW)
+    if last_boundary < 0:
+        last_boundary = _last_sentence_end(truncated, max_chars // 2)
 
     if last_boundary > max_chars * 0.5:  # Only use boundary if it's not too early
         return truncated[:last_boundary + 1] + " ...", True
@@ -56,6 +83,7 @@ def truncate_content(text: str, max_chars: int) -> Tuple[str, bool]:
     return truncated + " ...", True
 
 
+@lru_cache(maxsize=512)
 def format_duration(seconds: int) -> str:
     """
     Convert seconds to human-readable duration format.
@@ -89,6 +117,7 @@ def format_duration(seconds: int) -> str:
     return " ".join(parts)
 
 
+@lru_cache(maxsize=512)
 def format_duration_short(seconds: int) -> str:
     """Convert seconds to short rounded duration for titles.
 
@@ -111,9 +140,109 @@ def format_duration_short(seconds: int) -> str:
     return f"~{rounded:.1f}h"
 
 
-def check_url_head(url: str, timeout: int = 5) -> dict:
+# DNS cache for the HEAD session only (see _CachedDNSAdapter): requests/urllib3
+# resolve the host on every new connection, so bulk HEAD checks against the same
+# hosts repeat identical lookups. getaddrinfo() doesn't expose record TTLs, so
+# entries live for a short fixed time instead.
+_DNS_TTL_SECONDS = 60
+_DNS_CACHE_MAX = 1024
+_dns_cache: dict[tuple, tuple[float, list]] = {}
+_dns_lock = threading.Lock()
+
+
+def _cached_getaddrinfo(host: str, port: int) -> list:
+    """socket.getaddrinfo() for a TCP connection, caching successful lookups for _DNS_TTL_SECONDS."""
+    key = (host, port)
+    now = time.monotonic()
+    with _dns_lock:
+        entry = _dns_cache.get(key)
+    if entry and entry[0] > now:
+        return entry[1]
+
+    result = socket.getaddrinfo(host, port, allowed_gai_family(), socket.SOCK_STREAM)
+    with _dns_lock:
+        if len(_dns_cache) >= _DNS_CACHE_MAX:
+            _dns_cache.clear()
+        _dns_cache[key] = (now + _DNS_TTL_SECONDS, result)
+    return result
+
+
+class _CachedDNSConnectionMixin:
+    """Connects to the cached addresses of the host, trying each in turn.
+
+    Only the socket target changes: Host header, SNI and certificate checks
+    still use the original host name.
+    """
+
+    def _new_conn(self):
+        host = self._dns_host
+        try:
+            addresses = [sockaddr[0] for *_, sockaddr in _cached_getaddrinfo(host, self.port)]
+        except OSError:
+            addresses = [host]  # let urllib3 report the resolution error
+        try:
+            for i, address in enumerate(addresses):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError):
+                    if i == len(addresses) - 1:
+                        raise
+        finally:
+            self._dns_host = host
+
+
+class _CachedDNSHTTPConnection(_CachedDNSConnectionMixin, HTTPConnection):
+    pass
+
+
+class _CachedDNSHTTPSConnection(_CachedDNSConnectionMixin, HTTPSConnection):
+    pass
+
+
+class _CachedDNSHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _CachedDNSHTTPConnection
+
+
+class _CachedDNSHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _CachedDNSHTTPSConnection
+
+
+class _CachedDNSAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections resolve hosts through _cached_getaddrinfo()."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CachedDNSHTTPConnectionPool,
+            "https": _CachedDNSHTTPSConnectionPool,
+        }
+
+
+# Shared session so repeated HEAD checks reuse keep-alive connections per host
+_SESSION = requests.Session()
+_SESSION.headers["User-Agent"] = "Mozilla/5.0 (compatible; unknownews-enricher)"
+for _prefix in ("https://", "http://"):
+    _SESSION.mount(_prefix, _CachedDNSAdapter(pool_connections=64, pool_maxsize=64, max_retries=0))
+
+
+# HEAD results persist across runs; failures get a shorter TTL so they're retried sooner
+HEAD_CACHE_TYPE = "head"
+HEAD_CACHE_TTL_DAYS = 7
+HEAD_CACHE_ERROR_TTL_DAYS = 1
+
+
+def check_url_head(url: str, timeout: int = 5, use_cache: bool = True) -> dict:
     """Issue a HEAD request to check URL reachability and content type.
 
+    Results are cached (7 days for 2xx/3xx, 1 day for 4xx/5xx); network
+    errors are never cached.
+
+    Args:
+        url: URL to check
+        timeout: Request timeout in seconds
+        use_cache: If False, skip the cache lookup (result is still stored)
+
     Returns:
         Dict with keys:
             status (int): HTTP status code, 0 on network error
@@ -121,17 +250,26 @@ def check_url_head(url: str, timeout: int = 5) -> dict:
             is_html (bool): True if content-type contains text/html
             fetchable (bool): True if status is 2xx/3xx (or unknown on error)
     """
+    if use_cache:
+        cached = get_cache(url, HEAD_CACHE_TYPE, max_age_days=HEAD_CACHE_TTL_DAYS)
+        if cached is not None:
+            return cached
+
     try:
-        resp = requests.head(url, timeout=timeout, allow_redirects=True)
+        resp = _SESSION.head(url, timeout=timeout, allow_redirects=True)
         status = resp.status_code
         content_type = resp.headers.get("content-type", "").lower()
         is_html = "text/html" in content_type or "application/xhtml+xml" in content_type
         fetchable = status < 400
-        return {"status": status, "content_type": content_type, "is_html": is_html, "fetchable": fetchable}
     except Exception:
         # Network error / timeout — assume fetchable HTML so we still try
         return {"status": 0, "content_type": "", "is_html": True, "fetchable": True}
 
+    result = {"status": status, "content_type": content_type, "is_html": is_html, "fetchable": fetchable}
+    ttl_days = HEAD_CACHE_TTL_DAYS if fetchable else HEAD_CACHE_ERROR_TTL_DAYS
+    set_cache(url, result, HEAD_CACHE_TYPE, ttl_days=ttl_days)
+    return result
+
 
 _DOCUMENT_MIME_TYPES = {
     "application/pdf": "pdf",
@@ -177,6 +315,46 @@ def is_document_url(url: str) -> str | None:
     return None
 
 
+# URL paths that point at site assets / plumbing rather than readable content
+_RESOURCE_PATH_RE = re.compile(
+    r"(\.(ico|png|jpe?g|gif|svg|webp|woff2?)$|/robots\.txt$|/\.well-known/|/wp-admin/|/favicon[^/]*\.\w+$)",
+    re.IGNORECASE,
+)
+
+# Also names of ordinary pages (github.com/mrdoob/three.js, .../vercel/next.js),
+# so these suffixes only count as a resource when the server doesn't serve HTML
+_SCRIPT_PATH_RE = re.compile(r"\.(css|js)$", re.IGNORECASE)
+
+
+def is_resource_url(url: str) -> bool:
+    """Check if URL points to a static asset or site plumbing (favicon, robots.txt, ...).
+
+    Such URLs have no content worth enriching, so callers can skip
+    the fetch + LLM pipeline entirely. A .js/.css path is only a resource
+    when its (cached) HEAD check reports a non-HTML content type.
+    """
+    try:
+        path = urlparse(url).path
+    except Exception:
+        return False
+    if _RESOURCE_PATH_RE.search(path):
+        return True
+    if _SCRIPT_PATH_RE.search(path):
+        head = check_url_head(url)
+        return head["fetchable"] and not head["is_html"]
+    return False
+
+
+_VIDEO_DOMAINS = frozenset({
+    "youtube.com",
+    "youtu.be",
+    "vimeo.com",
+    "dailymotion.com",
+    "twitch.tv",
+})
+
+
+@lru_cache(maxsize=4096)
 def is_video_url(url: str) -> bool:
     """
     Detect if URL points to a video platform.
@@ -191,18 +369,49 @@ def is_video_url(url: str) -> bool:
         True if URL is from a known video platform
     """
     try:
-        domain = urlparse(url).netloc.lower()
-        # Remove www. prefix
-        domain = domain.replace('www.', '')
-
-        video_domains = [
-            'youtube.com',
-            'youtu.be',
-            'vimeo.com',
-            'dailymotion.com',
-            'twitch.tv',
-        ]
-
-        return any(vd in domain for vd in video_domains)
+        return _registered_domain(urlparse(url).hostname) in _VIDEO_DOMAINS
     except Exception:
         return False
+
+
+def _registered_domain(host: Optional[str]) -> str:
+    """Return the last two labels of a (lowercased) hostname: m.youtube.com -> youtube.com."""
+    return ".".join((host or "").rsplit(".", 2)[-2:])
+
+
+_YOUTUBE_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+# youtube.com paths that carry the video ID as the next segment
+_YOUTUBE_ID_PATH_PREFIXES = ("/shorts/", "/embed/", "/live/", "/v/")
+
+
+@lru_cache(maxsize=4096)
+def extract_youtube_id(url: str) -> Optional[str]:
+    """
+    Extract the video ID from a YouTube URL without making network requests.
+
+    Handles youtube.com/watch?v=, youtu.be/, /shorts/, /embed/, /live/ and /v/
+    URLs on any youtube.com subdomain (www., m., music.).
+
+    Args:
+        url: URL to check
+
+    Returns:
+        11-character video ID, or None if url isn't a YouTube video URL
+    """
+    try:
+        parsed = urlparse(url)
+        domain = _registered_domain(parsed.hostname)
+        path = parsed.path
+        if domain == "youtu.be":
+            candidate = path[1:].split("/", 1)[0]
+        elif domain != "youtube.com":
+            return None
+        elif path.rstrip("/") == "/watch":
+            candidate = parse_qs(parsed.query).get("v", [""])[0]
+        elif path.startswith(_YOUTUBE_ID_PATH_PREFIXES):
+            candidate = path.split("/", 3)[2]
+        else:
+            return None
+    except Exception:
+        return None
+    return candidate if _YOUTUBE_ID_RE.fullmatch(candidate) else None
@@ -0,0 +1,36 @@
+"""JSON helpers that use orjson when installed, stdlib json otherwise."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse JSON from a str or bytes payload.
+
+    Bytes are passed straight to orjson, skipping the UTF-8 decode step.
+
+    Raises:
+        json.JSONDecodeError: On invalid input (orjson's error subclasses it)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(value: Any) -> str:
+    """Serialize value to compact JSON text, keeping non-ASCII characters as-is.
+
+    Same output as json.dumps(value, ensure_ascii=False), minus the spaces
+    after separators.
+
+    Raises:
+        TypeError: If value isn't JSON-serializable
+    """
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
@@ -1,34 +1,55 @@
 """URL normalization and matching utilities."""
 
-from urllib.parse import urlparse
+import re
+import sys
+from functools import lru_cache
+from urllib.parse import SplitResult, urlsplit, uses_params
 
 # Tracking params to always strip from URLs
-TRACKING_PARAMS = {
+TRACKING_PARAMS = frozenset({
     "utm_source", "utm_medium", "utm_campaign", "utm_term", "utm_content",
     "ref", "source", "fbclid", "gclid", "mc_cid", "mc_eid", "si",
-}
+})
+
+# Matches anywhere a tracking param name occurs; queries without a match have
+# nothing to strip. Substring match, so false positives just take the slow path
+_TRACKING_PARAM_RE = re.compile("|".join(sorted(map(re.escape, TRACKING_PARAMS))), re.IGNORECASE)
 
-# Domain-specific params that identify the resource (for fuzzy matching)
+# Domain-specific params that identify the resource (for fuzzy matching).
+# Frozensets, so they can be passed to the memoized filter_query_params()
 DOMAIN_ID_PARAMS = {
-    "youtube.com": {"v", "list"},
-    "www.youtube.com": {"v", "list"},
-    "youtu.be": set(),  # ID is in path
-    "vimeo.com": set(),  # ID is in path
-    "open.spotify.com": set(),  # ID is in path
-    "github.com": set(),  # ID is in path
+    "youtube.com": frozenset({"v", "list"}),
+    "www.youtube.com": frozenset({"v", "list"}),
+    "youtu.be": frozenset(),  # ID is in path
+    "vimeo.com": frozenset(),  # ID is in path
+    "open.spotify.com": frozenset(),  # ID is in path
+    "github.com": frozenset(),  # ID is in path
 }
 
+# The same URLs are normalized repeatedly (newsletter index build, then once per
+# Linkwarden link when matching); results are pure functions of the input string
+_URL_CACHE_SIZE = 65536
+
+# Plain http(s) URLs split into scheme/netloc/path/query/fragment in one scan.
+# Anything urlsplit() would treat specially (other schemes, upper-case scheme,
+# IPv6 brackets, non-ASCII hosts, tab/CR/LF) doesn't match and takes urlsplit()
+_URL_RE = re.compile(
+    r"(https?)://([^/?#\[\]\x00-\x20\x7f-\U0010ffff]*)((?:/[^?#\t\r\n]*)?)"
+    r"(?:\?([^#\t\r\n]*))?(?:#([^\t\r\n]*))?"
+)
+
 # Generic ID-like params to preserve for unknown domains
-GENERIC_ID_PARAMS = {"v", "id", "p", "pid", "vid", "article", "story", "post"}
+GENERIC_ID_PARAMS = frozenset({"v", "id", "p", "pid", "vid", "article", "story", "post"})
 
 
-def filter_query_params(query: str, keep_only: set[str] | None = None) -> str:
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def filter_query_params(query: str, keep_only: frozenset[str] | None = None) -> str:
     """Filter query string, removing tracking params.
 
     Args:
         query: The query string (without leading ?)
         keep_only: If provided, only keep params in this set (in addition to removing tracking).
-                   If None, keep all non-tracking params.
+                   If None, keep all non-tracking params. Must be hashable (results are memoized).
 
     Returns:
         Filtered query string (without leading ?)
@@ -36,12 +57,13 @@ def filter_query_params(query: str, keep_only: set[str] | None = None) -> str:
     if not query:
         return ""
 
+    # Fast path: nothing to strip and no whitelist, so the query is kept as-is
+    if keep_only is None and not _TRACKING_PARAM_RE.search(query):
+        return query
+
     filtered = []
     for param in query.split("&"):
-        if "=" in param:
-            key = param.split("=")[0].lower()
-        else:
-            key = param.lower()
+        key = param.partition("=")[0].lower()
 
         # Always skip tracking params
         if key in TRACKING_PARAMS:
@@ -56,37 +78,47 @@ def filter_query_params(query: str, keep_only: set[str] | None = None) -> str:
     return "&".join(filtered)
 
 
-def normalize_url(url: str) -> str:
-    """Normalize URL for matching: strip trailing slash, handle http/https, remove fragments and tracking params."""
-    if not url:
-        return ""
-
-    parsed = urlparse(url.strip())
+def _split(url: str) -> tuple[SplitResult, str]:
+    """Split a URL, returning the parts and its path without ;params.
 
+    urlsplit() skips urlparse()'s params pass and result object; the params
+    are dropped here the same way urlparse() separates them (last segment only).
+    Common http(s) URLs skip urlsplit() too and are split by _URL_RE.
+    """
+    match = _URL_RE.fullmatch(url)
+    if match:
+        scheme, netloc, path, query, fragment = match.groups()
+        parsed = SplitResult(scheme, netloc, path, query or "", fragment or "")
+    else:
+        parsed = urlsplit(url)
+    path = parsed.path
+    if ";" in path and parsed.scheme in uses_params:
+        params_at = path.find(";", max(path.rfind("/"), 0))
+        if params_at >= 0:
+            path = path[:params_at]
+    return parsed, path
+
+
+def _normalize_parsed(parsed: SplitResult, path: str) -> str:
+    """Build the normalized URL from an already split URL."""
     # Filter query params (remove tracking, keep everything else)
     filtered_query = filter_query_params(parsed.query, keep_only=None)
 
     # Rebuild URL without fragment, with filtered query
     scheme = "https" if parsed.scheme in ("http", "https") else parsed.scheme
-    normalized = f"{scheme}://{parsed.netloc}{parsed.path}"
+    normalized = f"{scheme}://{parsed.netloc}{path}"
     if filtered_query:
         normalized += f"?{filtered_query}"
 
-    return normalized
+    # Different inputs often normalize to the same URL (http/https, tracking
+    # params): interning shares one string object between cache and indexes
+    return sys.intern(normalized)
 
 
-def get_url_path_key(url: str) -> str:
-    """Extract domain, path, and significant query params for fuzzy matching.
-
-    Preserves ID-like query parameters for sites that use them (YouTube, etc.)
-    while stripping tracking params and other noise.
-    """
-    if not url:
-        return ""
-
-    parsed = urlparse(url.strip())
+def _path_key_parsed(parsed: SplitResult, path: str) -> str:
+    """Build the fuzzy path key from an already split URL."""
     netloc = parsed.netloc.lower()
-    path = parsed.path.rstrip("/")
+    path = path.rstrip("/")
 
     # Determine which params to keep based on domain
     params_to_keep = DOMAIN_ID_PARAMS.get(netloc, GENERIC_ID_PARAMS)
@@ -101,4 +133,40 @@ def get_url_path_key(url: str) -> str:
         sorted_params = sorted(filtered_query.lower().split("&"))
         key += "?" + "&".join(sorted_params)
 
-    return key.lower()
+    return sys.intern(key.lower())
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def normalize_url(url: str) -> str:
+    """Normalize URL for matching: strip trailing slash, handle http/https, remove fragments and tracking params."""
+    if not url:
+        return ""
+
+    return _normalize_parsed(*_split(url.strip()))
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def get_url_path_key(url: str) -> str:
+    """Extract domain, path, and significant query params for fuzzy matching.
+
+    Preserves ID-like query parameters for sites that use them (YouTube, etc.)
+    while stripping tracking params and other noise.
+    """
+    if not url:
+        return ""
+
+    return _path_key_parsed(*_split(url.strip()))
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def normalize_and_key(url: str) -> tuple[str, str]:
+    """Compute both normalize_url() and get_url_path_key() with a single parse.
+
+    Returns:
+        Tuple of (normalized_url, path_key); both empty for an empty URL
+    """
+    if not url:
+        return "", ""
+
+    parsed, path = _split(url.strip())
+    return _normalize_parsed(parsed, path), _path_key_parsed(parsed, path)
@@ -5,6 +5,7 @@ from .format import format_content_for_llm
 from . import llm_cache, article_cache
 from transcriber import yt_dlp_cache
 from common.display import console
+from common.fetcher_utils import is_resource_url
 from .enrich_llm import enrich_content
 
 
@@ -25,6 +26,7 @@ def enrich_url(
     verbose: int = 0,
     extra_context: dict | None = None,
     status=None,
+    force: bool = False,
 ) -> dict | None:
     """Fetch content for a URL and enrich it with LLM.
 
@@ -38,13 +40,14 @@ def enrich_url(
             Can include: tags, description, title, date, etc.
             This data is passed to the LLM as additional context.
         status: Optional rich Status object to update with phase info
+        force: Ignore cached LLM results (by URL and by content) and call the LLM again
 
     Returns:
         Dict with keys: title, description, tags, category, suggested_category
         Returns None on failure, or dict with _skipped=True if content unavailable
     """
     # Check LLM cache first
-    cached_result = llm_cache.get_cached(url)
+    cached_result = None if force else llm_cache.get_cached(url)
     if cached_result is not None and not cached_result.get("_skipped"):
         if "_original_title" not in cached_result:
             cached_result["_original_title"] = _get_cached_title(url)
@@ -52,6 +55,10 @@ def enrich_url(
             console.print("  [dim]Using cached LLM result[/dim]")
         return cached_result
 
+    if is_resource_url(url):
+        console.print("[dim]  Resource URL, skipping enrichment[/dim]")
+        return {"_skipped": True, "_reason": "resource URL"}
+
     # Fetch content
     if hasattr(status, "update"):
         status.update("  Fetching content...")
@@ -94,5 +101,5 @@ def enrich_url(
     return enrich_content(
         url, formatted_content,
         original_title=content_data.get("title") or "",
-        prompt_path=prompt_path, verbose=verbose, file_url=file_url,
+        prompt_path=prompt_path, verbose=verbose, file_url=file_url, force=force,
     )
@@ -6,15 +6,13 @@ Routes URLs to appropriate fetchers (article, video, or document).
 
 from typing import Optional, Dict, Any
 
-from common.fetcher_utils import is_video_url, is_document_content_type, is_document_url, truncate_content, RateLimitError, ContentFetchError, check_url_head  # noqa: F401
-from .article_fetcher import fetch_article_content, fetch_article_with_playwright, extract_article_from_html, is_js_wall
+from common.fetcher_utils import is_video_url, is_document_content_type, is_document_url, RateLimitError, check_url_head  # noqa: F401
+from .article_fetcher import fetch_article_content, fetch_article_with_playwright, is_js_wall
 from transcriber.video_fetcher import fetch_video_content
 from .document_fetcher import fetch_document_content
 from common.display import console
 from . import article_cache
 
-CONTENT_MAX_CHARS = 64_000
-
 
 def _fetch_video(url: str, verbose: int = 0, force: bool = False) -> Optional[Dict[str, Any]]:
     """Fetch video content and wrap in standard result dict."""
@@ -63,6 +61,22 @@ def _fetch_document(url: str, head: dict, verbose: int = 0) -> Optional[Dict[str
     }
 
 
+def _build_article_result(url: str, article_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap article fetcher output in standard result dict."""
+    return {
+        "content_type": "article",
+        "url": url,
+        "title": article_data.get("title"),
+        "text_content": article_data.get("text_content"),
+        "transcript": None,
+        "chapters": None,
+        "tags": None,
+        "metadata": article_data.get("metadata", {}),
+        "fetch_method": article_data.get("_fetch_method", "trafilatura"),
+        "success": True,
+    }
+
+
 def _fetch_article(url: str, verbose: int = 0, force: bool = False) -> Optional[Dict[str, Any]]:
     """Fetch article content via trafilatura with Playwright fallback."""
     article_data = fetch_article_content(url, verbose=verbose, force=force)
@@ -75,20 +89,7 @@ def _fetch_article(url: str, verbose: int = 0, force: bool = False) -> Optional[
     if not article_data:
         return None
 
-    fetch_method = article_data.get("_fetch_method", "trafilatura")
-
-    return {
-        "content_type": "article",
-        "url": url,
-        "title": article_data.get("title"),
-        "text_content": article_data.get("text_content"),
-        "transcript": None,
-        "chapters": None,
-        "tags": None,
-        "metadata": article_data.get("metadata", {}),
-        "fetch_method": fetch_method,
-        "success": True,
-    }
+    return _build_article_result(url, article_data)
 
 
 def fetch_content(url: str, verbose: int = 0, force: bool = False) -> Optional[Dict[str, Any]]:
@@ -121,22 +122,10 @@ def fetch_content(url: str, verbose: int = 0, force: bool = False) -> Optional[D
                 article_data = fetch_article_with_playwright(url, verbose=verbose, force=True)
 
         if article_data:
-            fetch_method = article_data.get("_fetch_method", "trafilatura")
-            return {
-                "content_type": "article",
-                "url": url,
-                "title": article_data.get("title"),
-                "text_content": article_data.get("text_content"),
-                "transcript": None,
-                "chapters": None,
-                "tags": None,
-                "metadata": article_data.get("metadata", {}),
-                "fetch_method": fetch_method,
-                "success": True,
-            }
+            return _build_article_result(url, article_data)
 
         # HEAD pre-check
-        head = check_url_head(url)
+        head = check_url_head(url, use_cache=not force)
         if not head["fetchable"]:
             if verbose >= 1:
                 console.print(f"  [dim]URL unreachable (HTTP {head['status']})[/dim]")
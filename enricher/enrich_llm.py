@@ -1,24 +1,44 @@
 """Enrichment-specific LLM orchestration - calls LLM, parses results."""
 
 import html
-import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from urllib.parse import urlparse
 
 from .llm import call_api
 from . import llm_cache
 from common.display import console
+from common.json_utils import loads
 
 PROMPT_PATH = "prompts/enrich-link.md"
 
+# JSON wrapped in a Markdown code block (```json ... ```)
+_JSON_BLOCK_RE = re.compile(r"```(?:json)?\s*\n?(.*?)\n?```", re.DOTALL)
+
+
+@lru_cache(maxsize=16)
+def _read_prompt(resolved_path: str, mtime_ns: int) -> str:
+    """Read a prompt file; cached per path and modification time."""
+    return Path(resolved_path).read_text(encoding="utf-8")
+
 
 def load_prompt(prompt_path: str) -> str:
-    """Load prompt template from file."""
+    """Load prompt template from file.
+
+    The file is read once per process and re-read only when it changes on disk.
+    """
     path = Path(prompt_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Prompt file not found: {prompt_path}")
-    return path.read_text(encoding="utf-8")
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Prompt file not found: {prompt_path}") from None
+    return _read_prompt(str(path.resolve()), mtime_ns)
+
+
+def _maybe_unescape(text: str) -> str:
+    """Decode HTML entities, skipping the work when there can't be any."""
+    return html.unescape(text) if text and "&" in text else text
 
 
 def parse_json_response(response_text: str) -> dict | None:
@@ -30,20 +50,20 @@ def parse_json_response(response_text: str) -> dict | None:
     if not response_text:
         return None
 
-    # Try to extract JSON from Markdown code block
-    json_match = re.search(r"```(?:json)?\s*\n?(.*?)\n?```", response_text, re.DOTALL)
-    if json_match:
-        json_str = json_match.group(1).strip()
-    else:
-        json_str = response_text.strip()
+    json_str = response_text.strip()
+    # Bare JSON object (json_mode responses) needs no code block extraction
+    if not json_str.startswith("{"):
+        json_match = _JSON_BLOCK_RE.search(response_text)
+        if json_match:
+            json_str = json_match.group(1).strip()
 
     try:
-        data = json.loads(json_str)
+        data = loads(json_str)
         if data is None:
             return {"_skipped": True, "_reason": "LLM couldn't access content"}
-        title = html.unescape(data.get("title", "") or "")
-        description = html.unescape(data.get("description", "") or "")
-        tags = [html.unescape(t) for t in data.get("tags", [])]
+        title = _maybe_unescape(data.get("title", "") or "")
+        description = _maybe_unescape(data.get("description", "") or "")
+        tags = [_maybe_unescape(t) for t in data.get("tags", [])]
         return {
             "title": title,
             "description": description,
@@ -51,7 +71,7 @@ def parse_json_response(response_text: str) -> dict | None:
             "category": data.get("category", ""),
             "suggested_category": data.get("suggested_category"),
         }
-    except json.JSONDecodeError as e:
+    except ValueError as e:  # JSONDecodeError from either json or orjson
         console.print(f"[yellow]JSON parse error: {e}[/yellow]")
         return None
 
@@ -91,7 +111,19 @@ def is_description_empty(description: str) -> bool:
     return not description or not description.strip()
 
 
-def enrich_content(url: str, formatted_content: str, original_title: str = "", prompt_path: str | None = None, verbose: int = 0, file_url: str | None = None) -> dict | None:
+def _cached_by_content(url: str, fingerprint: str, original_title: str, verbose: int) -> dict | None:
+    """Reuse the LLM result of identical content seen under another URL (tracking params, mirrors)."""
+    cached = llm_cache.get_cached_by_content(fingerprint)
+    if not cached:
+        return None
+    if verbose >= 1:
+        console.print("  [dim]LLM result reused from identical content[/dim]")
+    result = {**cached, "_original_title": original_title}
+    llm_cache.set_cached(url, result)
+    return result
+
+
+def enrich_content(url: str, formatted_content: str, original_title: str = "", prompt_path: str | None = None, verbose: int = 0, file_url: str | None = None, force: bool = False) -> dict | None:
     """Call LLM to enrich a URL given pre-formatted content.
 
     Args:
@@ -101,6 +133,7 @@ def enrich_content(url: str, formatted_content: str, original_title: str = "", p
         prompt_path: Path to the prompt template file
         verbose: Verbosity level (0=quiet, 1=details, 2=LLM prompts)
         file_url: Optional file URL for multimodal API
+        force: Call the LLM even if identical content has a cached result
 
     Returns:
         Dict with keys: title, description, tags (list), category, suggested_category
@@ -115,8 +148,12 @@ def enrich_content(url: str, formatted_content: str, original_title: str = "", p
         console.print(f"[red]Error: {e}[/red]")
         return None
 
-    response_text = call_api(formatted_content, prompt_template, verbose=verbose, file_url=file_url)
+    fingerprint = llm_cache.content_fingerprint(prompt_template, formatted_content, file_url)
+    cached = None if force else _cached_by_content(url, fingerprint, original_title, verbose)
+    if cached:
+        return cached
 
+    response_text = call_api(formatted_content, prompt_template, verbose=verbose, file_url=file_url)
     if not response_text:
         console.print("[yellow]  Empty response from API[/yellow]")
         return None
@@ -138,4 +175,5 @@ def enrich_content(url: str, formatted_content: str, original_title: str = "", p
         console.print(f"[dim]  Parsed: title({title_len} chars), desc({desc_len} chars), {num_tags} tags, category={cat}[/dim]")
     if not result.get("_skipped"):
         llm_cache.set_cached(url, result)
+        llm_cache.set_cached_by_content(fingerprint, result)
     return result
@@ -1,6 +1,11 @@
 """Format fetched content as XML for LLM consumption."""
 
 
+def _append_block(lines: list[str], tag: str, body: str) -> None:
+    """Append a multi-line <tag>...</tag> block; the (large) body is never copied."""
+    lines.extend((f"<{tag}>", body, f"</{tag}>"))
+
+
 def format_content_for_llm(content_data: dict) -> str:
     """Format fetched content as XML-like structure for LLM parsing.
 
@@ -29,9 +34,7 @@ def format_content_for_llm(content_data: dict) -> str:
             lines.append(f"<sitename>{metadata['sitename']}</sitename>")
 
         if content_data.get('text_content'):
-            lines.append("<content>")
-            lines.append(content_data['text_content'])
-            lines.append("</content>")
+            _append_block(lines, "content", content_data['text_content'])
 
     elif content_data['content_type'] == 'document':
         metadata = content_data.get('metadata', {})
@@ -39,9 +42,7 @@ def format_content_for_llm(content_data: dict) -> str:
             lines.append(f"<doc_type>{metadata['doc_type']}</doc_type>")
 
         if content_data.get('text_content'):
-            lines.append("<content>")
-            lines.append(content_data['text_content'])
-            lines.append("</content>")
+            _append_block(lines, "content", content_data['text_content'])
 
     elif content_data['content_type'] == 'video':
         if metadata.get('uploader'):
@@ -62,19 +63,13 @@ def format_content_for_llm(content_data: dict) -> str:
             lines.append("</chapters>")
 
         if content_data.get('tags'):
-          lines.append("<tags>")
-          lines.append(", ".join(content_data['tags']))
-          lines.append("</tags>")
+            _append_block(lines, "tags", ", ".join(content_data['tags']))
 
         if content_data.get('text_content'):
-            lines.append("<description>")
-            lines.append(content_data['text_content'])
-            lines.append("</description>")
+            _append_block(lines, "description", content_data['text_content'])
 
         if content_data.get('transcript'):
-            lines.append("<transcript>")
-            lines.append(content_data['transcript'])
-            lines.append("</transcript>")
+            _append_block(lines, "transcript", content_data['transcript'])
 
     lines.append("</fetched_content>")
     return "\n".join(lines)
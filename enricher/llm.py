@@ -1,9 +1,12 @@
 """Generic OpenAI-compatible API client."""
 
 import os
+import random
+import threading
 import time
+from functools import lru_cache
 
-from openai import OpenAI
+from openai import APIConnectionError, APITimeoutError, InternalServerError, OpenAI, RateLimitError
 from openai.types.chat import ChatCompletionSystemMessageParam, ChatCompletionUserMessageParam
 from openai.types.shared_params import ResponseFormatJSONObject
 
@@ -11,6 +14,65 @@ from common.display import console
 
 DEFAULT_MODEL = "gpt-4o-mini"
 
+# Transient failures worth retrying; anything else (auth, bad request, bugs) fails fast
+_RETRYABLE_ERRORS = (RateLimitError, APIConnectionError, APITimeoutError, InternalServerError)
+_MAX_RETRY_WAIT_SECONDS = 60
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Seconds to wait before the next attempt.
+
+    Honors the server's Retry-After header when present; otherwise uses
+    full-jitter exponential backoff so concurrent workers don't retry in lockstep.
+    """
+    response = getattr(error, "response", None)
+    retry_after = response.headers.get("retry-after") if response is not None else None
+    if retry_after:
+        try:
+            return min(float(retry_after), _MAX_RETRY_WAIT_SECONDS)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return random.uniform(0, min(2 ** attempt, _MAX_RETRY_WAIT_SECONDS))
+
+
+# Client-side request pacing (OPENAI_MAX_RPM), shared by all worker threads so
+# batch enrichment stays under the provider's rate limit instead of hitting 429s.
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _throttle() -> None:
+    """Block until the next request slot when OPENAI_MAX_RPM is set."""
+    global _next_request_at
+    try:
+        max_rpm = float(os.environ.get("OPENAI_MAX_RPM", "0"))
+    except ValueError:
+        max_rpm = 0
+    if max_rpm <= 0:
+        return
+
+    with _throttle_lock:
+        now = time.monotonic()
+        slot = max(now, _next_request_at)
+        _next_request_at = slot + 60.0 / max_rpm
+    if slot > now:
+        time.sleep(slot - now)
+
+
+@lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: str | None) -> OpenAI:
+    """Return a shared OpenAI client so its HTTP connection pool is reused across calls."""
+    client_kwargs = {"api_key": api_key}
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return OpenAI(**client_kwargs)
+
+
+@lru_cache(maxsize=8)
+def _system_message(prompt: str) -> ChatCompletionSystemMessageParam:
+    """Return the system message for a prompt; prompts repeat across a batch so build it once."""
+    return {"role": "system", "content": prompt}
+
 
 def call_api(user_prompt: str, system_prompt: str | None = None, max_retries: int = 1, verbose: int = 0, file_url: str | None = None, json_mode: bool = True) -> str | None:
   api_key = os.environ.get("OPENAI_API_KEY")
@@ -67,30 +129,32 @@ def call_api(user_prompt: str, system_prompt: str | None = None, max_retries: in
     ))
     console.print("")
 
-  # Initialize client
-  client_kwargs = {"api_key": api_key}
-  if base_url:
-    client_kwargs["base_url"] = base_url
-  client = OpenAI(**client_kwargs)
+  client = _get_client(api_key, base_url)
+  system_message = _system_message(system_prompt) if system_prompt else None
 
   # Call API with retry logic
   for attempt in range(max_retries):
     try:
+      _throttle()
       if use_responses_api:
         response_text = call_responses_api(client, model, user_prompt, system_prompt, service_tier=service_tier, file_url=file_url)
       else:
-        response_text = call_chat_completions_api(client, model, user_prompt, system_prompt, service_tier=service_tier, json_mode=json_mode)
+        response_text = call_chat_completions_api(client, model, user_prompt, service_tier=service_tier, json_mode=json_mode, system_message=system_message)
       return response_text
 
-    except Exception as e:
+    except _RETRYABLE_ERRORS as e:
       if attempt < max_retries - 1:
-        wait_time = 2 ** attempt  # Exponential backoff: 1, 2, 4 seconds
-        console.print(f"[yellow]API error, retrying in {wait_time}s: {e}[/yellow]")
+        wait_time = _retry_delay(attempt + 1, e)
+        console.print(f"[yellow]API error, retrying in {wait_time:.1f}s: {e}[/yellow]")
         time.sleep(wait_time)
       else:
         console.print(f"[red]API error after {max_retries} attempts: {e}[/red]")
         return None
 
+    except Exception as e:
+      console.print(f"[red]API error: {e}[/red]")
+      return None
+
 
 def call_responses_api(client: OpenAI, model: str, user_prompt: str, system_prompt: str | None = None, service_tier: str | None = None, file_url: str | None = None) -> str | None:
     """Call OpenAI Responses API.
@@ -127,21 +191,24 @@ def call_responses_api(client: OpenAI, model: str, user_prompt: str, system_prom
         input=input_content,
         service_tier=service_tier,
     )
-    # Extract text from response output
-    response_text = getattr(response, "output_text", None)
-    if not response_text:
-        for item in getattr(response, "output", []):
-            if getattr(item, "type", "") == "message":
-                for content in getattr(item, "content", []):
-                    if getattr(content, "type", "") == "output_text":
-                        response_text = getattr(content, "text", "")
-                        break
-            if response_text:
-                break
-    return response_text
-
-
-def call_chat_completions_api(client: OpenAI, model: str, user_prompt: str, system_prompt: str | None = None, service_tier: str | None = None, json_mode: bool = True) -> str | None:
+    # output_text is the SDK's aggregated text; walk the output items only if it's missing
+    return getattr(response, "output_text", None) or _extract_from_output(response)
+
+
+def _extract_from_output(response) -> str | None:
+    """Return the first non-empty output_text content from a Responses API response."""
+    for item in getattr(response, "output", []):
+        if getattr(item, "type", "") != "message":
+            continue
+        for content in getattr(item, "content", []):
+            if getattr(content, "type", "") == "output_text":
+                text = getattr(content, "text", "")
+                if text:
+                    return text
+    return None
+
+
+def call_chat_completions_api(client: OpenAI, model: str, user_prompt: str, system_prompt: str | None = None, service_tier: str | None = None, json_mode: bool = True, system_message: ChatCompletionSystemMessageParam | None = None) -> str | None:
     """Call OpenAI Chat Completions API.
 
     Args:
@@ -149,15 +216,17 @@ def call_chat_completions_api(client: OpenAI, model: str, user_prompt: str, syst
         model: Model name
         user_prompt: User message content (formatted content or URL)
         system_prompt: Optional system instructions
+        system_message: Optional prebuilt system message (takes precedence over system_prompt)
 
     Returns:
         Response text or None
     """
     messages = []
 
-    if system_prompt:
-        message_system_prompt: ChatCompletionSystemMessageParam = {"role": "system", "content": system_prompt}
-        messages.append(message_system_prompt)
+    if system_message is None and system_prompt:
+        system_message = _system_message(system_prompt)
+    if system_message:
+        messages.append(system_message)
 
     message_user_prompt: ChatCompletionUserMessageParam = {"role": "user", "content": user_prompt}
     messages.append(message_user_prompt)
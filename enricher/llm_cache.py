@@ -3,11 +3,18 @@
 This is a thin wrapper around the unified cache service.
 """
 
+import hashlib
+import re
 from typing import Optional
 from common.cache import get_cache, set_cache, remove_cache
 
 CACHE_TYPE = "llm"
 CACHE_TTL_DAYS = 30
+# Same results keyed by prompt+content hash, so URL variants of one article share a hit
+CONTENT_CACHE_TYPE = "llm_content"
+
+# The <url> line format_content_for_llm() writes; left out of the fingerprint
+_URL_LINE_RE = re.compile(r"^<url>[^\n]*</url>$\n?", re.MULTILINE)
 
 
 def get_cached(url: str) -> Optional[dict]:
@@ -39,3 +46,40 @@ def remove_cached(url: str) -> None:
         url: URL to remove from cache
     """
     remove_cache(url, CACHE_TYPE)
+
+
+def content_fingerprint(prompt: str, formatted_content: str, file_url: str | None = None) -> str:
+    """Build a cache key from the prompt and the fetched content, ignoring the URL.
+
+    The <url> line is dropped so the same article under another URL (tracking
+    params, mirrors, redirects) maps to the same key. Documents still include
+    their file URL, which the LLM reads directly.
+    """
+    content = _URL_LINE_RE.sub("", formatted_content, count=1)
+    digest = hashlib.sha256()
+    for part in (prompt, content, file_url or ""):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def get_cached_by_content(fingerprint: str) -> Optional[dict]:
+    """Get cached LLM result for identical prompt + content.
+
+    Args:
+        fingerprint: Key from content_fingerprint()
+
+    Returns:
+        Cached enrichment result dict or None
+    """
+    return get_cache(fingerprint, CONTENT_CACHE_TYPE, max_age_days=CACHE_TTL_DAYS)
+
+
+def set_cached_by_content(fingerprint: str, result: dict) -> None:
+    """Cache LLM result under a content fingerprint.
+
+    Args:
+        fingerprint: Key from content_fingerprint()
+        result: Enrichment result to cache
+    """
+    set_cache(fingerprint, result, CONTENT_CACHE_TYPE, ttl_days=CACHE_TTL_DAYS)
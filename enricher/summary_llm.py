@@ -29,20 +29,22 @@ def summarize_url(url: str, verbose: int = 0, force: bool = False) -> str | None
     if result is None or result.get("_skip_fallback"):
         return None
 
-    return summarize_content(result, verbose=verbose, force=force)
+    # Cache was checked above (or bypassed by force)
+    return summarize_content(result, verbose=verbose, force=force, check_cache=False)
 
 
-def summarize_content(content_data: dict, verbose: int = 0, force: bool = False) -> str | None:
+def summarize_content(content_data: dict, verbose: int = 0, force: bool = False, check_cache: bool = True) -> str | None:
     """Generate an LLM summary from pre-fetched content data.
 
-    Checks summary cache, formats content, calls LLM, caches result.
+    Checks summary cache (unless check_cache is False, e.g. the caller already did),
+    formats content, calls LLM, caches result.
 
     Returns:
         Summary markdown string, or None on failure.
     """
     url = content_data.get("url") or content_data.get("original_url") or ""
 
-    if url and not force:
+    if url and check_cache and not force:
         cached = summary_cache.get_cached(url)
         if cached:
             if verbose:
@@ -15,7 +15,9 @@ def format_enriched_title(llm_title: str, original_title: str) -> str:
     Returns:
         Formatted title string
     """
-    original_title = html.unescape(original_title) if original_title else ""
+    if original_title and "&" in original_title:
+        original_title = html.unescape(original_title)
+    original_title = original_title or ""
 
     if llm_title and original_title and llm_title != original_title:
         return f"{llm_title} [{original_title}]"
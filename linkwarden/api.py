@@ -1,10 +1,51 @@
 """Linkwarden API client."""
+import atexit
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from common.json_utils import dumps, loads
 from .config import get_api_config
+from .tag_utils import tag_names
 
 _verbose = False
 
+# One session for all API calls: keep-alive connections are reused instead of a
+# new TCP/TLS handshake per request, and concurrent callers (parallel collection
+# fetches, deletes) share the pool. Transient 429/5xx responses are retried with
+# backoff; the last response is returned as-is so callers' status checks still apply.
+_SESSION = requests.Session()
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=(429, 500, 502, 503, 504),
+    raise_on_status=False,
+)
+for _prefix in ("https://", "http://"):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=_RETRY))
+atexit.register(_SESSION.close)
+
+# Request bodies are serialized with json_utils.dumps (orjson when available)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _get_base_url() -> str:
+    """Read the API config and make sure the session sends the current token.
+
+    The Authorization header lives on the session instead of being rebuilt for
+    every request; it is only replaced when the configured token changes.
+    """
+    base_url, token = get_api_config()
+    auth = f"Bearer {token}"
+    if _SESSION.headers.get("Authorization") != auth:
+        _SESSION.headers["Authorization"] = auth
+    return base_url
+
+
+def _json_body(payload: dict) -> bytes:
+    """Encode a request payload as UTF-8 JSON."""
+    return dumps(payload).encode()
+
 
 def set_verbose(enabled: int | bool) -> None:
     """Enable or disable verbose API logging."""
@@ -36,14 +77,13 @@ def fetch_all_collections() -> list[dict]:
 
     Automatically reads LINKWARDEN_URL and LINKWARDEN_TOKEN from environment.
     """
-    base_url, token = get_api_config()
-    headers = {"Authorization": f"Bearer {token}"}
+    base_url = _get_base_url()
     url = f"{base_url}/api/v1/collections"
     _log_request("GET", url)
     t0 = time.monotonic()
-    response = requests.get(url, headers=headers)
+    response = _SESSION.get(url)
     response.raise_for_status()
-    data = response.json()
+    data = loads(response.content)
     # API returns {"response": [...]}
     result = data.get("response", [])
     _log_response(response, time.monotonic() - t0, len(result))
@@ -58,8 +98,7 @@ def iter_collection_links(collection_id: int):
     Args:
         collection_id: Collection ID to fetch links from
     """
-    base_url, token = get_api_config()
-    headers = {"Authorization": f"Bearer {token}"}
+    base_url = _get_base_url()
     cursor = None
 
     while True:
@@ -68,9 +107,10 @@ def iter_collection_links(collection_id: int):
             url += f"&cursor={cursor}"
         _log_request("GET", url)
         t0 = time.monotonic()
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url)
         response.raise_for_status()
-        result = response.json()
+        # Pages can be large: parse the raw bytes (orjson when available)
+        result = loads(response.content)
 
         data = result.get("data", {})
         links = data.get("links", [])
@@ -122,18 +162,14 @@ def update_link(
     if dry_run:
         return True
 
-    base_url, token = get_api_config()
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
+    base_url = _get_base_url()
 
     link_id = link["id"]
 
     # Build updated link object - start with existing link
     # Merge new tags with existing ones
     existing_tags = link.get("tags", [])
-    existing_tag_names = {t.get("name", "") for t in existing_tags}
+    existing_tag_names = tag_names(existing_tags)
     tags_to_add = [{"name": t} for t in new_tags if t not in existing_tag_names]
     merged_tags = existing_tags + tags_to_add
 
@@ -150,7 +186,7 @@ def update_link(
     url = f"{base_url}/api/v1/links/{link_id}"
     _log_request("PUT", url)
     t0 = time.monotonic()
-    response = requests.put(url, headers=headers, json=payload)
+    response = _SESSION.put(url, headers=_JSON_HEADERS, data=_json_body(payload))
     _log_response(response, time.monotonic() - t0)
     if not response.ok:
         print(f"    API Error: {response.status_code} - {response.text}")
@@ -166,38 +202,37 @@ def delete_link(link_id: int) -> bool:
     Args:
         link_id: ID of link to delete
     """
-    base_url, token = get_api_config()
-    headers = {"Authorization": f"Bearer {token}"}
+    base_url = _get_base_url()
     url = f"{base_url}/api/v1/links/{link_id}"
     _log_request("DELETE", url)
     t0 = time.monotonic()
-    response = requests.delete(url, headers=headers)
+    response = _SESSION.delete(url)
     _log_response(response, time.monotonic() - t0)
     response.raise_for_status()
     return True
 
 
-def fetch_link_archive(link_id: int, format_type: int) -> str | None:
+def fetch_link_archive(link_id: int, format_type: int, as_bytes: bool = False) -> str | bytes | None:
     """Fetch an archived version of a link from Linkwarden.
 
     Args:
         link_id: Link ID
         format_type: Archive format (3=Readability JSON, 4=Monolith HTML)
+        as_bytes: If True, return the raw response body without decoding
 
     Returns:
-        Response text content, or None on error/404
+        Response text (or bytes) content, or None on error/404
     """
-    base_url, token = get_api_config()
-    headers = {"Authorization": f"Bearer {token}"}
+    base_url = _get_base_url()
     url = f"{base_url}/api/v1/archives/{link_id}?format={format_type}"
     _log_request("GET", url)
     t0 = time.monotonic()
     try:
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url)
         _log_response(response, time.monotonic() - t0)
         if not response.ok:
             return None
-        return response.text
+        return response.content if as_bytes else response.text
     except Exception:
         return None
 
@@ -223,12 +258,7 @@ def create_link(
     Returns:
         The created link data from the API
     """
-    base_url, token = get_api_config()
-
-    headers = {
-        "Authorization": f"Bearer {token}",
-        "Content-Type": "application/json",
-    }
+    base_url = _get_base_url()
 
     payload = {
         "name": name,
@@ -241,7 +271,7 @@ def create_link(
     url = f"{base_url}/api/v1/links"
     _log_request("POST", url)
     t0 = time.monotonic()
-    response = requests.post(url, headers=headers, json=payload)
+    response = _SESSION.post(url, headers=_JSON_HEADERS, data=_json_body(payload))
     _log_response(response, time.monotonic() - t0)
     if not response.ok:
         raise Exception(f"API Error: {response.status_code} - {response.text}")
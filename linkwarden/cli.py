@@ -30,6 +30,7 @@ def _add_remove_duplicates_parser(subparsers):
     """Add the 'remove-duplicates' subcommand parser."""
     p = subparsers.add_parser("remove-duplicates", help="Find and remove duplicate links across all collections")
     p.add_argument("--dry-run", action="store_true", help="Preview deletions without actually deleting")
+    p.add_argument("--fuzzy-strong", action="store_true", help="Also report near-duplicate URLs (typo in the last path segment) for review; never deleted")
     p.add_argument("-v", "--verbose", action="count", default=0, help="-v for details, -vv for full metadata")
 
 
@@ -94,7 +95,7 @@ def dispatch(args) -> int:
         list_links(collection_id=args.collection, verbose=args.verbose)
         return 0
     elif args.command == "remove-duplicates":
-        remove_duplicates(dry_run=args.dry_run, verbose=args.verbose)
+        remove_duplicates(dry_run=args.dry_run, verbose=args.verbose, fuzzy_strong=args.fuzzy_strong)
         return 0
     elif args.command == "enrich-all":
         enrich_all_links(
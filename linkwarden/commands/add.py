@@ -26,13 +26,13 @@ def _lookup_newsletter(url, normalized_url):
     except Exception:
         return None, None, None
 
-    if normalized_url in exact_index:
-        nl_data = exact_index[normalized_url]
+    nl_data = exact_index.get(normalized_url)
+    if nl_data is not None:
         return nl_data, "exact", nl_data.get("original_url", normalized_url)
 
     path_key = get_url_path_key(url)
-    if path_key and path_key in fuzzy_index:
-        nl_data = fuzzy_index[path_key]
+    nl_data = fuzzy_index.get(path_key) if path_key else None
+    if nl_data is not None:
         return nl_data, "fuzzy", nl_data.get("original_url", "")
 
     return None, None, None
@@ -1,6 +1,7 @@
 """Enrich links command - uses newsletter data and/or LLM to fill titles, descriptions, and tags."""
 
 import html
+from concurrent.futures import ThreadPoolExecutor
 
 from ..links import iter_collection_links, iter_all_links, update_link
 from ..collections_cache import get_collections
@@ -8,21 +9,24 @@ from ..config import get_api_config
 from ..lw_enricher import enrich_link, RateLimitError, is_title_empty, needs_enrichment
 from common.display import console, show_diff, format_tags_display
 from ..newsletter import load_newsletter_index, match_newsletter
-from ..tag_utils import get_system_tags, build_newsletter_tags
-from common.url_utils import normalize_url
+from ..tag_utils import get_system_tags, build_newsletter_tags, tag_names
+from common.url_utils import normalize_and_key
 from enricher.enrich_llm import enrich_content
 
+# Linkwarden updates are independent per link; they run in the background
+# while the next links are matched and enriched
+UPDATE_WORKERS = 8
 
-def _prepare_newsletter(link, nl_data):
+
+def _prepare_newsletter(link, nl_data, normalized_url):
     """Prepare newsletter changes for a link.
 
     Returns a dict of proposed changes, or None if nothing to update.
     """
     link_name = link.get("name", "Untitled")
     link_url = link.get("url", "")
-    normalized_url = normalize_url(link_url)
     existing_desc = link.get("description", "") or ""
-    existing_tags = {tag.get("name", "") for tag in link.get("tags", [])}
+    existing_tags = tag_names(link.get("tags", []))
 
     nl_title = nl_data.get("title", "")
     nl_description = nl_data.get("description", "")
@@ -32,7 +36,13 @@ def _prepare_newsletter(link, nl_data):
 
     # Check what needs updating
     new_tags = [t for t in tags_to_add if t not in existing_tags]
-    description_needs_update = nl_description and nl_description not in existing_desc
+    # Newsletter descriptions are prepended, so a startswith() usually settles it
+    # before the full substring search (kept for descriptions edited since)
+    description_needs_update = (
+        nl_description
+        and not existing_desc.startswith(nl_description)
+        and nl_description not in existing_desc
+    )
     name_needs_update = (
         nl_title
         and link_name
@@ -61,7 +71,7 @@ def _prepare_newsletter(link, nl_data):
     return changes
 
 
-def _prepare_llm(link, needs, prompt_path, verbose, nl_data=None):
+def _prepare_llm(link, needs, prompt_path, verbose, normalized_url, nl_data=None):
     """Prepare LLM changes for a link.
 
     Returns a dict of proposed changes, or a tuple ("failed", reason) / ("rate_limited", reason) on error.
@@ -106,7 +116,6 @@ def _prepare_llm(link, needs, prompt_path, verbose, nl_data=None):
                 return ("failed", f"Skipped: {reason}")
             # Only extract tags and category — not title or description
             changes = {}
-            normalized_url = normalize_url(link_url)
             if normalized_url and normalized_url != link_url:
                 changes["url"] = normalized_url
             if result.get("tags"):
@@ -125,7 +134,6 @@ def _prepare_llm(link, needs, prompt_path, verbose, nl_data=None):
 
     # Normalize URL (strip tracking params, fragments)
     link_url = link.get("url", "")
-    normalized_url = normalize_url(link_url)
     if normalized_url and normalized_url != link_url:
         changes["url"] = normalized_url
 
@@ -165,7 +173,7 @@ def _display_link_changes(link, final, nl_changes, llm_changes, dry_run, verbose
     link_name = html.unescape(link.get("name", "") or "Untitled")
     link_url = link.get("url", "")
     existing_desc = link.get("description", "") or ""
-    existing_tags = {tag.get("name", "") for tag in link.get("tags", [])}
+    existing_tags = tag_names(link.get("tags", []))
 
     dry_label = "[dim](dry-run)[/dim] " if dry_run else ""
     fuzzy_label = " [cyan]~[/cyan]" if match_type == "fuzzy" else ""
@@ -281,13 +289,8 @@ def _link_with_newsletter(link, nl_changes):
         existing_desc = link.get("description", "") or ""
         nl_desc = nl_changes["description"]
         updated["description"] = f"{nl_desc}\n\n---\n{existing_desc}" if existing_desc else nl_desc
-    # Add newsletter tags
-    existing_tag_names = {tag.get("name", "") for tag in link.get("tags", [])}
-    new_tags = list(link.get("tags", []))
-    for t in nl_changes.get("tags_to_add", []):
-        if t not in existing_tag_names:
-            new_tags.append({"name": t})
-    updated["tags"] = new_tags
+    # Add newsletter tags (_prepare_newsletter() already left out existing ones)
+    updated["tags"] = list(link.get("tags", [])) + [{"name": t} for t in nl_changes.get("new_tags", [])]
     return updated
 
 
@@ -299,7 +302,7 @@ def _apply_changes(link, final, dry_run, verbose):
             console.print(f"  [dim]Updated link #{link.get('id')} successfully[/dim]")
         return True
     except Exception as e:
-        console.print(f"  [red]! Update failed: {e}[/red]")
+        console.print(f"  [red]! Update failed for #{link.get('id')}: {e}[/red]")
         return False
 
 
@@ -372,55 +375,78 @@ def enrich_all_links(
     processed = 0
     total_seen = 0
     unmatched_urls = []
+    pending_updates = []  # list of (future, link, has_nl, has_llm)
+    rate_limited = False
 
-    for link in links:
-        total_seen += 1
-        if 0 < limit <= processed:
-            console.print(f"\n[dim]Limit of {limit} reached.[/dim]")
-            break
-
-        nl_changes = None
-        llm_changes = None
-        match_type = None
-        header_shown = False
-
-        # Newsletter pass
-        if use_newsletter:
-            nl_data, match_type = match_newsletter(link, newsletter_index, newsletter_fuzzy_index)
-            if nl_data:
-                nl_changes = _prepare_newsletter(link, nl_data)
-            else:
-                unmatched_urls.append(link.get("url", ""))
-
-        # LLM pass — use post-newsletter view for needs check (without mutating link)
-        if use_llm:
-            link_for_llm = _link_with_newsletter(link, nl_changes) if nl_changes and use_newsletter else link
-            needs = needs_enrichment(link_for_llm, force=force)
-            if any(needs.values()):
-                # Show which link is being processed before the slow LLM call
-                _link_name = html.unescape(link.get("name", "") or "Untitled")
-                _link_url = link.get("url", "")
-                console.print(f"{dry_label}#{link.get('id')}  [bold]{_link_name}[/bold]")
-                console.print(f"  [dim][link={_link_url}]{_link_url}[/link][/dim]")
-                header_shown = True
-                llm_changes = _prepare_llm(link, needs, prompt_path, verbose, nl_data=nl_data if use_newsletter else None)
-                if isinstance(llm_changes, tuple) and llm_changes[0] == "rate_limited":
-                    console.print(f"\n[dim]Stopped after processing {processed} links[/dim]")
-                    raise SystemExit(1)
-
-        # Display + update as one block
-        has_nl = nl_changes is not None
-        has_llm = isinstance(llm_changes, dict) and len(llm_changes) > 0
-        llm_failed = isinstance(llm_changes, tuple) and llm_changes[0] == "failed"
-
-        if has_nl or has_llm:
-            final = _build_final_values(link, nl_changes if has_nl else None, llm_changes if has_llm else None)
-            _display_link_changes(
-                link, final, nl_changes if has_nl else None, llm_changes if has_llm else None,
-                dry_run, verbose, match_type=match_type, header_shown=header_shown,
-            )
-            success = _apply_changes(link, final, dry_run, verbose)
-            if success:
+    try:
+        # Leaving the pool (normally, on a rate limit or on an error) waits for the
+        # queued updates, so none keep running unreported; the summary counts them all
+        with ThreadPoolExecutor(max_workers=UPDATE_WORKERS) as executor:
+            for link in links:
+                total_seen += 1
+                if 0 < limit <= processed:
+                    console.print(f"\n[dim]Limit of {limit} reached.[/dim]")
+                    break
+
+                nl_changes = None
+                llm_changes = None
+                match_type = None
+                header_shown = False
+                # Normalized once per link; shares the parse match_newsletter() does
+                normalized_url, _ = normalize_and_key(link.get("url", ""))
+
+                # Newsletter pass
+                if use_newsletter:
+                    nl_data, match_type = match_newsletter(link, newsletter_index, newsletter_fuzzy_index)
+                    if nl_data:
+                        nl_changes = _prepare_newsletter(link, nl_data, normalized_url)
+                    else:
+                        unmatched_urls.append(link.get("url", ""))
+
+                # LLM pass — use post-newsletter view for needs check (without mutating link)
+                if use_llm:
+                    link_for_llm = _link_with_newsletter(link, nl_changes) if nl_changes and use_newsletter else link
+                    needs = needs_enrichment(link_for_llm, force=force)
+                    if any(needs.values()):
+                        # Show which link is being processed before the slow LLM call
+                        _link_name = html.unescape(link.get("name", "") or "Untitled")
+                        _link_url = link.get("url", "")
+                        console.print(f"{dry_label}#{link.get('id')}  [bold]{_link_name}[/bold]")
+                        console.print(f"  [dim][link={_link_url}]{_link_url}[/link][/dim]")
+                        header_shown = True
+                        llm_changes = _prepare_llm(
+                            link, needs, prompt_path, verbose, normalized_url,
+                            nl_data=nl_data if use_newsletter else None,
+                        )
+                        if isinstance(llm_changes, tuple) and llm_changes[0] == "rate_limited":
+                            rate_limited = True
+                            break
+
+                # Display + update as one block
+                has_nl = nl_changes is not None
+                has_llm = isinstance(llm_changes, dict) and len(llm_changes) > 0
+                llm_failed = isinstance(llm_changes, tuple) and llm_changes[0] == "failed"
+
+                if has_nl or has_llm:
+                    final = _build_final_values(link, nl_changes if has_nl else None, llm_changes if has_llm else None)
+                    _display_link_changes(
+                        link, final, nl_changes if has_nl else None, llm_changes if has_llm else None,
+                        dry_run, verbose, match_type=match_type, header_shown=header_shown,
+                    )
+                    future = executor.submit(_apply_changes, link, final, dry_run, verbose)
+                    pending_updates.append((future, link, has_nl, has_llm))
+                    processed += 1
+                elif llm_failed:
+                    failed += 1
+                    failed_links.append((link.get("id"), link.get("url", ""), llm_changes[1]))
+                    processed += 1
+                elif has_nl is False and nl_changes is None and use_newsletter and verbose:
+                    # Newsletter matched but already up-to-date
+                    pass
+    finally:
+        # Tally the finished updates
+        for future, link, has_nl, has_llm in pending_updates:
+            if future.result():
                 if has_nl:
                     nl_updated += 1
                 if has_llm:
@@ -428,35 +454,31 @@ def enrich_all_links(
             else:
                 failed += 1
                 failed_links.append((link.get("id"), link.get("url", ""), "API update failed"))
-            processed += 1
-        elif llm_failed:
-            failed += 1
-            failed_links.append((link.get("id"), link.get("url", ""), llm_changes[1]))
-            processed += 1
-        elif has_nl is False and nl_changes is None and use_newsletter and verbose:
-            # Newsletter matched but already up-to-date
-            pass
-
-    # Summary
-    parts = []
-    if use_newsletter:
-        parts.append(f"[green]{nl_updated} newsletter[/green]")
-    if use_llm:
-        parts.append(f"[green]{llm_enriched} llm[/green]")
-    if failed:
-        parts.append(f"[red]{failed} failed[/red]")
-
-    console.print(f"\n{dry_label}[bold]{total_seen}[/bold] links scanned, {', '.join(parts)}")
-
-    if failed_links:
-        console.print(f"\n[red]Failed ({len(failed_links)}):[/red]")
-        for link_id, url, reason in failed_links:
-            console.print(f"  [dim]#{link_id}[/dim] {url}  [red]{reason}[/red]")
-
-    if use_newsletter and unmatched_urls:
-        if show_unmatched:
-            console.print(f"\n[dim]Unmatched ({len(unmatched_urls)}):[/dim]")
-            for url in unmatched_urls:
-                console.print(f"  [dim]{url}[/dim]")
-        else:
-            console.print(f"\n[dim]{len(unmatched_urls)} unmatched with the newsletter (use --show-unmatched to list)[/dim]")
+
+        # Summary
+        parts = []
+        if use_newsletter:
+            parts.append(f"[green]{nl_updated} newsletter[/green]")
+        if use_llm:
+            parts.append(f"[green]{llm_enriched} llm[/green]")
+        if failed:
+            parts.append(f"[red]{failed} failed[/red]")
+
+        console.print(f"\n{dry_label}[bold]{total_seen}[/bold] links scanned, {', '.join(parts)}")
+
+        if failed_links:
+            console.print(f"\n[red]Failed ({len(failed_links)}):[/red]")
+            for link_id, url, reason in failed_links:
+                console.print(f"  [dim]#{link_id}[/dim] {url}  [red]{reason}[/red]")
+
+        if use_newsletter and unmatched_urls:
+            if show_unmatched:
+                console.print(f"\n[dim]Unmatched ({len(unmatched_urls)}):[/dim]")
+                for url in unmatched_urls:
+                    console.print(f"  [dim]{url}[/dim]")
+            else:
+                console.print(f"\n[dim]{len(unmatched_urls)} unmatched with the newsletter (use --show-unmatched to list)[/dim]")
+
+    if rate_limited:
+        console.print(f"\n[dim]Stopped after processing {processed} links[/dim]")
+        raise SystemExit(1)
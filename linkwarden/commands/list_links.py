@@ -26,6 +26,7 @@ def list_links(collection_id: int | None = None, verbose: int = 0) -> None:
     base_url, _ = get_api_config()
 
     # Fetch links
+    collection_name = None
     with console.status("Fetching...", spinner="dots"):
         if collection_id is not None:
             links = fetch_collection_links(collection_id)
@@ -35,8 +36,6 @@ def list_links(collection_id: int | None = None, verbose: int = 0) -> None:
                 (c.get("name", f"Collection {collection_id}") for c in collections if c["id"] == collection_id),
                 f"Collection {collection_id}"
             )
-            for link in links:
-                link["_collection_name"] = collection_name
         else:
             links = fetch_all_links(silent=True)
 
@@ -44,10 +43,13 @@ def list_links(collection_id: int | None = None, verbose: int = 0) -> None:
         console.print("[dim]No links found.[/dim]")
         return
 
-    # Group links by collection
+    # Group links by collection (a single collection needs no per-link tagging)
     by_collection = defaultdict(list)
-    for link in links:
-        by_collection[link.get("_collection_name", "Unknown")].append(link)
+    if collection_name is not None:
+        by_collection[collection_name] = links
+    else:
+        for link in links:
+            by_collection[link.get("_collection_name", "Unknown")].append(link)
 
     # Calculate widths
     terminal_margin = 12
@@ -81,9 +83,7 @@ def list_links(collection_id: int | None = None, verbose: int = 0) -> None:
             line.append(f"  #{link_id:<5} ", style="dim")
             line.append(name, style=f"link {link_url}")
             if tags:
-                tag_lines = Text()
-                for tag in tags:
-                    tag_lines.append(f"[{tag}] ", style=f"dim {get_tag_color(tag)}")
+                tag_lines = Text.assemble(*((f"[{tag}] ", f"dim {get_tag_color(tag)}") for tag in tags))
 
                 if terminal_width - terminal_margin < len(name) + len(tag_lines):
                   line.append("\n            ")
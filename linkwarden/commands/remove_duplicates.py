@@ -1,12 +1,26 @@
 """Remove duplicates command."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from ..links import delete_link, fetch_all_links
 from ..config import get_api_config
 from common.display import console, show_diff
-from ..duplicates import find_duplicates
+from ..duplicates import find_duplicates, find_near_duplicates
+
+# Deletes are independent per link; a few in flight hide per-request latency
+DELETE_WORKERS = 8
+
 
+def _try_delete(link: dict) -> bool:
+    """Delete a link, returning False instead of raising on failure."""
+    try:
+        delete_link(link.get("id"))
+        return True
+    except Exception:
+        return False
 
-def remove_duplicates(dry_run: bool = False, verbose: int = 0) -> None:
+
+def remove_duplicates(dry_run: bool = False, verbose: int = 0, fuzzy_strong: bool = False) -> None:
     """Fetch all links across all collections, find duplicates, and remove them.
 
     Automatically reads LINKWARDEN_URL and LINKWARDEN_TOKEN from environment.
@@ -14,6 +28,8 @@ def remove_duplicates(dry_run: bool = False, verbose: int = 0) -> None:
     Args:
         dry_run: If True, preview duplicates without deleting
         verbose: If True, show extra metadata per duplicate
+        fuzzy_strong: If True, also report near-duplicates (path keys differing by a typo).
+            These are listed for review only and never deleted.
     """
     base_url, _ = get_api_config()
     dry_label = "[dim](dry-run)[/dim] " if dry_run else ""
@@ -22,21 +38,34 @@ def remove_duplicates(dry_run: bool = False, verbose: int = 0) -> None:
         all_links = fetch_all_links(silent=not dry_run)
 
     exact_groups, fuzzy_groups = find_duplicates(all_links)
-    total_to_delete = sum(len(g["links"]) - 1 for g in exact_groups + fuzzy_groups)
+    near_groups = []
+    if fuzzy_strong:
+        grouped_ids = {link["id"] for g in exact_groups + fuzzy_groups for link in g["links"]}
+        near_groups = find_near_duplicates(all_links, exclude_ids=grouped_ids)
 
-    console.print(f"[bold]{len(all_links)}[/bold] links, [red]{len(exact_groups)}[/red] exact + [yellow]{len(fuzzy_groups)}[/yellow] fuzzy duplicate groups\n")
+    near_label = f" + [magenta]{len(near_groups)}[/magenta] near" if fuzzy_strong else ""
+    console.print(f"[bold]{len(all_links)}[/bold] links, [red]{len(exact_groups)}[/red] exact + [yellow]{len(fuzzy_groups)}[/yellow] fuzzy{near_label} duplicate groups\n")
 
-    if not exact_groups and not fuzzy_groups:
+    if not exact_groups and not fuzzy_groups and not near_groups:
         console.print("[green]No duplicates found.[/green]")
         return
 
-    # Show duplicate groups with details
-    all_groups = [("exact", g) for g in exact_groups] + [("fuzzy", g) for g in fuzzy_groups]
+    # Show duplicate groups with details, collecting everything but the oldest link of each.
+    # Near matches can still be distinct pages, so they are only reported
+    all_groups = (
+        [("exact", g) for g in exact_groups]
+        + [("fuzzy", g) for g in fuzzy_groups]
+        + [("near", g) for g in near_groups]
+    )
+    links_to_delete = []
 
     for match_type, group in all_groups:
         links = sorted(group["links"], key=lambda x: x.get("id", 0))
+        review_only = match_type == "near"
+        if not review_only:
+            links_to_delete.extend(links[1:])
         key = group.get("normalized_url") or group.get("path_key", "")
-        emoji = "🎯" if match_type == "exact" else "🔍"
+        emoji = {"exact": "🎯", "fuzzy": "🔍"}.get(match_type, "≈")
 
         console.print(f"{emoji} [blue][link={key}]{key[:70]}[/link][/blue]")
         if verbose:
@@ -54,6 +83,10 @@ def remove_duplicates(dry_run: bool = False, verbose: int = 0) -> None:
 
             if i == 0:
                 console.print(f"  [green]keep[/green]   #{link_id:<5} [link={ui_url}]{name}[/link] [dim][{coll}][/dim]")
+            elif review_only:
+                console.print(f"  [magenta]review[/magenta] #{link_id:<5} [link={ui_url}]{name}[/link] [dim][{coll}][/dim]")
+                if link_url != first_url:
+                    show_diff(first_url, link_url, indent="         ", muted=True)
             else:
                 console.print(f"  [red]delete[/red] #{link_id:<5} [link={ui_url}]{name}[/link] [dim][{coll}][/dim]")
                 if link_url != first_url:
@@ -64,22 +97,17 @@ def remove_duplicates(dry_run: bool = False, verbose: int = 0) -> None:
                 console.print(f"           [dim]{tag_count} tags, created {created}[/dim]")
         console.print()
 
-    # Confirm and delete
-    links_to_delete = []
-    for group in exact_groups + fuzzy_groups:
-        sorted_links = sorted(group["links"], key=lambda x: x.get("id", 0))
-        links_to_delete.extend(sorted_links[1:])
+    if near_groups:
+        near_count = sum(len(g["links"]) - 1 for g in near_groups)
+        console.print(f"[magenta]{near_count}[/magenta] near-duplicate links to review (not deleted)")
 
+    # Confirm and delete
     if not dry_run:
-        deleted = 0
-        errors = 0
         with console.status("Deleting...", spinner="dots"):
-            for link in links_to_delete:
-                try:
-                    delete_link(link.get("id"))
-                    deleted += 1
-                except Exception:
-                    errors += 1
+            with ThreadPoolExecutor(max_workers=DELETE_WORKERS) as executor:
+                results = list(executor.map(_try_delete, links_to_delete))
+        deleted = sum(results)
+        errors = len(results) - deleted
         console.print(f"[red]{deleted} deleted[/red]" + (f", [red]{errors} errors[/red]" if errors else ""))
     else:
-        console.print(f"{dry_label}[red]{total_to_delete}[/red] would be deleted")
+        console.print(f"{dry_label}[red]{len(links_to_delete)}[/red] would be deleted")
@@ -1,10 +1,8 @@
 """Interactive TUI browser for Linkwarden links."""
 
 import html
-import json
 import webbrowser
 from collections import defaultdict
-from pathlib import Path
 
 from rich.text import Text
 from textual import work
@@ -14,11 +12,11 @@ from textual.containers import Horizontal
 from textual.screen import ModalScreen
 from textual.widgets import Footer, Header, Label, Markdown, Tree
 
+from common.cache import get_cache_keys, iter_cache_items
 from common.fetcher_utils import is_video_url
 from ..collections_cache import get_collections
 from ..links import fetch_all_links, fetch_collection_links
-
-_CACHE_DIR = Path("cache")
+from ..tag_utils import tag_names
 
 _MODE_LABELS = {
     1: "Short",
@@ -34,32 +32,25 @@ _QUICK_FILTERS: list[tuple[str, str]] = [
 
 
 def _load_cache_keys(cache_type: str) -> set[str]:
-    """Read a cache JSON file and return the set of stored URL keys (fast, one read)."""
-    path = _CACHE_DIR / f"{cache_type}.json"
-    if not path.exists():
-        return set()
+    """Return the set of stored URL keys for a cache type (fast, one query)."""
     try:
-        return set(json.loads(path.read_text(encoding="utf-8")).keys())
+        return get_cache_keys(cache_type)
     except Exception:
         return set()
 
 
-def _load_video_transcript_keys() -> set[str]:
-    """Return URLs from yt_dlp cache that have an actual transcript stored."""
-    path = _CACHE_DIR / "yt_dlp.json"
-    if not path.exists():
-        return set()
+def _load_video_transcript_keys(urls: list[str]) -> set[str]:
+    """Return the URLs whose video has an actual transcript in the yt_dlp cache."""
+    from transcriber.yt_dlp_cache import cache_key
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-        keys = set()
-        for url, entry in data.items():
-            # Entries with TTL are wrapped: {"timestamp": ..., "value": {...}}
-            value = entry.get("value", entry) if isinstance(entry, dict) else {}
-            if isinstance(value, dict) and value.get("_cached_transcript"):
-                keys.add(url)
-        return keys
+        keys = {
+            key for key, value in iter_cache_items("yt_dlp")
+            if isinstance(value, dict) and value.get("_cached_transcript")
+        }
     except Exception:
         return set()
+    # Cache keys are canonical video URLs (older entries: the URL as given)
+    return {url for url in urls if url in keys or cache_key(url) in keys}
 
 
 class _ConfirmFetchScreen(ModalScreen[bool]):
@@ -613,17 +604,14 @@ class LinkBrowserApp(App):
     @work(thread=True)
     def _enrich_worker(self, url: str, force: bool) -> None:
         """Runs in a background thread — blocking LLM call without freezing TUI."""
-        from enricher import llm_cache
         from ..lw_enricher import enrich_link, needs_enrichment, is_title_empty
         from ..links import update_link
         from common.url_utils import normalize_url
 
         link_snapshot = dict(self._selected_link or {})
         try:
-            if force:
-                llm_cache.remove_cached(url)
             needs = needs_enrichment(link_snapshot, force=force)
-            result = enrich_link(url, link=link_snapshot or None)
+            result = enrich_link(url, link=link_snapshot or None, force=force)
         except Exception:
             self.call_from_thread(self._on_enrich_done, url, None)
             return
@@ -695,7 +683,7 @@ class LinkBrowserApp(App):
                 self._selected_link["name"] = result["name"]
                 self._selected_link["url"] = result["url"]
                 self._selected_link["description"] = result["description"]
-                existing_tag_names = {t.get("name", "") for t in self._selected_link.get("tags", [])}
+                existing_tag_names = tag_names(self._selected_link.get("tags", []))
                 for tag_name in result.get("tags_new", []):
                     if tag_name not in existing_tag_names:
                         self._selected_link.setdefault("tags", []).append({"name": tag_name})
@@ -747,7 +735,9 @@ def launch_tui(collection_id: int | None = None) -> None:
         return
 
     summary_keys = _load_cache_keys("summary")
-    article_keys = _load_cache_keys("article") | _load_video_transcript_keys()
+    article_keys = _load_cache_keys("article") | _load_video_transcript_keys(
+        [link["url"] for link in links if link.get("url") and is_video_url(link["url"])]
+    )
     enriched_keys = _load_cache_keys("llm")
 
     app = LinkBrowserApp(links, summary_keys=summary_keys, article_keys=article_keys, enriched_keys=enriched_keys, collections=collections_meta)
@@ -1,7 +1,16 @@
 """Duplicate detection utilities."""
 
+import re
 from collections import defaultdict
-from common.url_utils import normalize_url, get_url_path_key
+from common.url_utils import normalize_and_key
+
+# find_near_duplicates(): at most this many edits between two final path
+# segments, and only one edit per NEAR_DUPLICATE_CHARS_PER_EDIT characters, so
+# short names (ruff/uv, bar/baz) never match
+NEAR_DUPLICATE_MAX_EDITS = 2
+NEAR_DUPLICATE_CHARS_PER_EDIT = 10
+
+_NUMBER_RE = re.compile(r"\d+")
 
 
 def find_duplicates(links: list[dict]) -> tuple[list[dict], list[dict]]:
@@ -11,33 +20,127 @@ def find_duplicates(links: list[dict]) -> tuple[list[dict], list[dict]]:
         - exact_groups: list of duplicate groups with exact URL matches
         - fuzzy_groups: list of duplicate groups with fuzzy path matches
     """
-    # Build exact match index: normalized_url -> [links]
+    # Build both indexes in one pass: normalized_url -> [links], path_key -> [links]
     exact_index = defaultdict(list)
+    fuzzy_index = defaultdict(list)
     for link in links:
-        normalized = normalize_url(link.get("url", ""))
+        normalized, path_key = normalize_and_key(link.get("url", ""))
         if normalized:
             exact_index[normalized].append(link)
+        if path_key:
+            fuzzy_index[path_key].append(link)
 
     # Extract exact duplicates (groups with 2+ links)
-    exact_groups = []
-    exact_link_ids = set()
-    for url, group in exact_index.items():
-        if len(group) > 1:
-            exact_groups.append({"normalized_url": url, "links": group, "match_type": "exact"})
-            exact_link_ids.update(link["id"] for link in group)
-
-    # Build fuzzy index for remaining links (not already in exact duplicates)
-    fuzzy_index = defaultdict(list)
-    for link in links:
-        if link["id"] not in exact_link_ids:
-            path_key = get_url_path_key(link.get("url", ""))
-            if path_key:
-                fuzzy_index[path_key].append(link)
-
-    # Extract fuzzy duplicates
-    fuzzy_groups = [
-        {"path_key": key, "links": group, "match_type": "fuzzy"}
-        for key, group in fuzzy_index.items() if len(group) > 1
+    exact_groups = [
+        {"normalized_url": url, "links": group, "match_type": "exact"}
+        for url, group in exact_index.items()
+        if len(group) > 1
     ]
+    exact_link_ids = frozenset(link["id"] for group in exact_groups for link in group["links"])
+
+    # Extract fuzzy duplicates from links not already in exact duplicates.
+    # Only candidate groups (2+ links) need the membership check.
+    fuzzy_groups = []
+    for key, group in fuzzy_index.items():
+        if len(group) < 2:
+            continue
+        remaining = [link for link in group if link["id"] not in exact_link_ids]
+        if len(remaining) > 1:
+            fuzzy_groups.append({"path_key": key, "links": remaining, "match_type": "fuzzy"})
 
     return exact_groups, fuzzy_groups
+
+
+def _find_root(parent: list[int], i: int) -> int:
+    """Union-find root lookup with path halving."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
+
+def _within_edits(a: str, b: str, max_edits: int) -> bool:
+    """Whether the Levenshtein distance between a and b is at most max_edits."""
+    if abs(len(a) - len(b)) > max_edits:
+        return False
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b),
+            ))
+        # Every path through the rest of the table passes through this row
+        if min(current) > max_edits:
+            return False
+        previous = current
+    return previous[-1] <= max_edits
+
+
+def find_near_duplicates(
+    links: list[dict],
+    exclude_ids: set | frozenset = frozenset(),
+    max_edits: int = NEAR_DUPLICATE_MAX_EDITS,
+) -> list[dict]:
+    """Find links whose path keys differ only by a small typo in the last segment (opt-in).
+
+    Catches near-duplicates that find_duplicates() misses, e.g. a slug with a
+    missing or swapped letter. Only links with the same host, the same parent
+    path and the same significant query params are compared, and only their
+    final path segments: those must be within a few edits of each other
+    (fewer for short segments) and contain the same numbers, so
+    /issues/123 and /issues/124, or github.com/astral-sh/ruff and
+    github.com/astral-sh/uv, never match.
+
+    Args:
+        links: Links to check
+        exclude_ids: IDs of links already in exact/fuzzy duplicate groups
+        max_edits: Maximum edit distance between two final path segments
+
+    Returns:
+        List of duplicate groups ({"path_key", "links", "match_type": "near"})
+    """
+    # (host, parent path, query) -> [(final segment, numbers, path key, link)]
+    by_parent = defaultdict(list)
+    for link in links:
+        if link["id"] in exclude_ids:
+            continue
+        _, path_key = normalize_and_key(link.get("url", ""))
+        path, _, query = path_key.partition("?")
+        host, _, path = path.partition("/")
+        parent, _, segment = path.rpartition("/")
+        if segment:
+            by_parent[(host.removeprefix("www."), parent, query)].append(
+                (segment, _NUMBER_RE.findall(segment), path_key, link)
+            )
+
+    near_groups = []
+    for entries in by_parent.values():
+        if len(entries) < 2:
+            continue
+
+        # Cluster transitively: a~b and b~c puts a, b, c in one group
+        parent_of = list(range(len(entries)))
+        for i, (segment_a, numbers_a, _, _) in enumerate(entries):
+            for j in range(i + 1, len(entries)):
+                segment_b, numbers_b, _, _ = entries[j]
+                if numbers_b != numbers_a or segment_a == segment_b:
+                    continue
+                allowed = min(max_edits, min(len(segment_a), len(segment_b)) // NEAR_DUPLICATE_CHARS_PER_EDIT)
+                if allowed and _within_edits(segment_a, segment_b, allowed):
+                    parent_of[_find_root(parent_of, j)] = _find_root(parent_of, i)
+
+        clusters = defaultdict(list)
+        for i in range(len(entries)):
+            clusters[_find_root(parent_of, i)].append(i)
+        for members in clusters.values():
+            if len(members) > 1:
+                near_groups.append({
+                    "path_key": entries[members[0]][2],
+                    "links": [entries[i][3] for i in members],
+                    "match_type": "near",
+                })
+
+    return near_groups
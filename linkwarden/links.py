@@ -1,5 +1,7 @@
 """Linkwarden link operations — wraps raw API calls for use by commands."""
 
+from concurrent.futures import ThreadPoolExecutor
+
 from .api import (
     create_link,
     delete_link,
@@ -23,6 +25,24 @@ __all__ = [
 ]
 
 
+def _iter_annotated_links(collection: dict):
+    """Yield a collection's links tagged with _collection_name / _collection_id."""
+    collection_id = collection["id"]
+    collection_name = collection.get("name", f"Collection {collection_id}")
+    for link in iter_collection_links(collection_id):
+        link["_collection_name"] = collection_name
+        link["_collection_id"] = collection_id
+        yield link
+
+
+def _print_collection_count(base_url: str, collection: dict, count: int) -> None:
+    """Print one progress line: collection name (linked) and its link count."""
+    collection_id = collection["id"]
+    collection_name = collection.get("name", f"Collection {collection_id}")
+    collection_url = f"{base_url}/collections/{collection_id}"
+    console.print(f"  [dim][link={collection_url}]{collection_name}[/link][/dim] [green]{count}[/green]")
+
+
 def iter_all_links(silent: bool = False):
     """Yield links from all collections (generator).
 
@@ -35,28 +55,42 @@ def iter_all_links(silent: bool = False):
     collections = get_collections()
 
     for collection in collections:
-        collection_id = collection["id"]
-        collection_name = collection.get("name", f"Collection {collection_id}")
         count = 0
-        for link in iter_collection_links(collection_id):
-            link["_collection_name"] = collection_name
-            link["_collection_id"] = collection_id
+        for link in _iter_annotated_links(collection):
             count += 1
             yield link
         if not silent:
-            collection_url = f"{base_url}/collections/{collection_id}"
-            console.print(f"  [dim][link={collection_url}]{collection_name}[/link][/dim] [green]{count}[/green]")
+            _print_collection_count(base_url, collection, count)
 
     if not silent:
         console.print("")
 
 
-def fetch_all_links(silent: bool = False) -> list[dict]:
+def fetch_all_links(silent: bool = False, workers: int = 8) -> list[dict]:
     """Fetch all links from all collections.
 
-    Convenience wrapper around iter_all_links() that returns a list.
+    Collections are fetched concurrently, but links are returned in the same
+    order as iter_all_links() (collection by collection, API order).
+
+    Automatically reads LINKWARDEN_URL and LINKWARDEN_TOKEN from environment.
 
     Args:
         silent: If True, don't print progress messages
+        workers: Maximum number of collections fetched at the same time
     """
-    return list(iter_all_links(silent=silent))
+    base_url, _ = get_api_config()
+    collections = get_collections()
+
+    all_links = []
+    if collections:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields results in submission order, so output order is stable
+            results = executor.map(lambda c: list(_iter_annotated_links(c)), collections)
+            for collection, links in zip(collections, results):
+                all_links.extend(links)
+                if not silent:
+                    _print_collection_count(base_url, collection, len(links))
+
+    if not silent:
+        console.print("")
+    return all_links
@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 
 from common.fetcher_utils import truncate_content
 from common.display import console
+from common.json_utils import loads
 from .api import fetch_link_archive
 from enricher.article_fetcher import extract_article_from_html
 
@@ -41,10 +42,10 @@ def fetch_linkwarden_content(link: dict, verbose: int = 0) -> Optional[Dict[str,
 
     # Step 2: Readable archive (format=3)
     if not text_content and link.get("readable") and link["readable"] != "unavailable":
-        raw = fetch_link_archive(link_id, 3)
+        raw = fetch_link_archive(link_id, 3, as_bytes=True)
         if raw:
             try:
-                data = _json.loads(raw)
+                data = loads(raw)
                 readable_text = (data.get("textContent") or "").strip()
                 if readable_text:
                     text_content, _ = truncate_content(readable_text, CONTENT_MAX_CHARS)
@@ -14,6 +14,7 @@ from enricher import llm_cache
 from .lw_content import fetch_linkwarden_content
 from .tag_utils import has_real_tags
 from common.display import console
+from common.fetcher_utils import is_resource_url
 
 
 def needs_enrichment(link: dict, force: bool = False) -> dict:
@@ -43,6 +44,7 @@ def enrich_link(
     link: dict | None = None,
     status=None,
     extra_context: dict | None = None,
+    force: bool = False,
 ) -> dict | None:
     """Enrich a URL with LLM, with Linkwarden content fallback.
 
@@ -56,20 +58,26 @@ def enrich_link(
         link: Optional Linkwarden link dict for fallback content fetching
         status: Optional rich Status object to update with phase info
         extra_context: Optional pre-existing metadata from any source
+        force: Ignore cached LLM results (by URL and by content) and call the LLM again
 
     Returns:
         Dict with keys: title, description, tags, category, suggested_category
         Returns None on failure, or dict with _skipped=True if content unavailable
     """
     # Check LLM cache first
-    cached_result = llm_cache.get_cached(url)
+    cached_result = None if force else llm_cache.get_cached(url)
     if cached_result is not None and not cached_result.get("_skipped"):
         if verbose >= 1:
             console.print("  [dim]Using cached LLM result[/dim]")
         return cached_result
 
+    # Static assets / site plumbing: nothing to enrich, not even via Linkwarden fallback.
+    # After the cache lookup: a .js/.css path may need a HEAD request to decide
+    if is_resource_url(url):
+        return {"_skipped": True, "_reason": "resource URL"}
+
     # Try generic enricher first
-    result = enrich_url(url, prompt_path=prompt_path, verbose=verbose, extra_context=extra_context, status=status)
+    result = enrich_url(url, prompt_path=prompt_path, verbose=verbose, extra_context=extra_context, status=status, force=force)
 
     # If content fetch failed but we have a Linkwarden link, try LW fallback
     if result and result.get("_skipped") and link:
@@ -86,7 +94,7 @@ def enrich_link(
             result = enrich_content(
                 url, formatted_content,
                 original_title=lw_content.get("title") or "",
-                prompt_path=prompt_path, verbose=verbose,
+                prompt_path=prompt_path, verbose=verbose, force=force,
             )
 
     return result
@@ -1,10 +1,10 @@
 """Newsletter index loading and management."""
 
-import json
 import os
 from typing import Any, TypedDict
 
-from common.url_utils import normalize_url, get_url_path_key
+from common.json_utils import loads
+from common.url_utils import normalize_and_key
 
 JSONL_PATH = "data/newsletters.jsonl"
 
@@ -35,12 +35,13 @@ def load_newsletter_index(
     exact_index: dict[str, LinkIndexEntry] = {}
     fuzzy_index: dict[str, LinkIndexEntry] = {}
 
-    with open(jsonl_path, "r", encoding="utf-8") as f:
+    # Binary read: orjson parses UTF-8 bytes directly, no per-line str decode
+    with open(jsonl_path, "rb") as f:
         for line in f:
             line = line.strip()
             if not line:
                 continue
-            newsletter: dict[str, Any] = json.loads(line)
+            newsletter: dict[str, Any] = loads(line)
             date = newsletter.get("date", "")
             for link in newsletter.get("links", []):
                 url = link.get("link", "")
@@ -50,10 +51,9 @@ def load_newsletter_index(
                     "date": date,
                     "original_url": url,
                 }
-                normalized = normalize_url(url)
+                normalized, path_key = normalize_and_key(url)
                 if normalized:
                     exact_index[normalized] = data
-                path_key = get_url_path_key(url)
                 if path_key:
                     fuzzy_index[path_key] = data
     return exact_index, fuzzy_index
@@ -64,14 +64,15 @@ def match_newsletter(link, newsletter_index, newsletter_fuzzy_index):
 
   Returns (nl_data, match_type) or (None, None).
   """
-  lw_url = link.get("url", "")
-  normalized = normalize_url(lw_url)
+  # Both keys from one (memoized) parse; no URL work left at match time on repeats
+  normalized, path_key = normalize_and_key(link.get("url", ""))
 
-  if normalized in newsletter_index:
-    return newsletter_index[normalized], "exact"
+  nl_data = newsletter_index.get(normalized)
+  if nl_data is not None:
+    return nl_data, "exact"
 
-  path_key = get_url_path_key(lw_url)
-  if path_key in newsletter_fuzzy_index:
-    return newsletter_fuzzy_index[path_key], "fuzzy"
+  nl_data = newsletter_fuzzy_index.get(path_key)
+  if nl_data is not None:
+    return nl_data, "fuzzy"
 
   return None, None
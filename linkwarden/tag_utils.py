@@ -2,23 +2,32 @@
 
 import re
 
-# Pattern for date tags (YYYY-MM-DD)
+# Pattern for date tags (YYYY-MM-DD); _is_date_tag() is the fast equivalent used at runtime
 DATE_TAG_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}$")
 
 # System tags that should be preserved and not counted as "real" tags
 SYSTEM_TAGS = {"unknow", "unread"}
 
 
+def _is_date_tag(tag_name: str) -> bool:
+    """Check for a YYYY-MM-DD tag with fixed-offset character checks (no regex)."""
+    return (
+        len(tag_name) == 10
+        and tag_name[4] == "-"
+        and tag_name[7] == "-"
+        and tag_name.isascii()
+        and tag_name[:4].isdigit()
+        and tag_name[5:7].isdigit()
+        and tag_name[8:].isdigit()
+    )
+
+
 def is_system_tag(tag_name: str) -> bool:
     """Check if a tag is a system tag (unknow or date format).
 
     Returns True for "unknow" or date tags (YYYY-MM-DD).
     """
-    if tag_name in SYSTEM_TAGS:
-        return True
-    if DATE_TAG_PATTERN.match(tag_name):
-        return True
-    return False
+    return tag_name in SYSTEM_TAGS or _is_date_tag(tag_name)
 
 
 def has_real_tags(tags: list[dict]) -> bool:
@@ -26,11 +35,12 @@ def has_real_tags(tags: list[dict]) -> bool:
 
     Returns True if link has any tags that are not "unknow" or date tags.
     """
-    for tag in tags:
-        tag_name = tag.get("name", "")
-        if not is_system_tag(tag_name):
-            return True
-    return False
+    return any(not is_system_tag(tag.get("name", "")) for tag in tags)
+
+
+def tag_names(tags: list[dict]) -> set[str]:
+    """Return the set of tag names, for membership checks against new tags."""
+    return {tag.get("name", "") for tag in tags}
 
 
 def filter_system_tags(tags: list[dict]) -> list[dict]:
@@ -12,20 +12,36 @@ from rich.console import Console
 
 console = Console(highlight=False)
 
+# Whitespace cleanup, applied to every text fragment (html_to_markdown recurses per element)
+_SPACE_AFTER_QUOTE_RE = re.compile(r'(["„‟]) +')
+_SPACE_BEFORE_PUNCT_RE = re.compile(r' +([.,;:!?])')
+_MULTI_SPACE_RE = re.compile(r' +')
+_LINE_LEADING_SPACE_RE = re.compile(r'\n +')
+_BLANK_LINES_RE = re.compile(r'\n\s*\n')
+
+# Newsletter page parsing
+_TITLE_TAG_PREFIX_RE = re.compile(r'^\[#uN]\s*')
+_TITLE_EMOJI_PREFIX_RE = re.compile(r'^[🌀?\s]+')
+_OG_IMAGE_DATE_RE = re.compile(r'/og/(\d{8})\.png')
+_INFO_PREFIX_RE = re.compile(r"^INFO:\s*")
+_INFO_TEXT_RE = re.compile(r"INFO:\s*(.+)$")
+_NUMBER_PREFIX_RE = re.compile(r"^\d+\.\s*")
+_ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _collapse_spaces(text: str) -> str:
+    """Tabs to spaces, drop spaces around quotes/punctuation, collapse runs, trim line starts."""
+    text = text.replace('\t', ' ')
+    text = _SPACE_AFTER_QUOTE_RE.sub(r'\1', text)   # space after opening quote
+    text = _SPACE_BEFORE_PUNCT_RE.sub(r'\1', text)  # space before punctuation
+    text = _MULTI_SPACE_RE.sub(' ', text)            # multiple spaces
+    text = _LINE_LEADING_SPACE_RE.sub('\n', text)    # leading spaces on lines
+    return text
+
 
 def clean_text(text: str) -> str:
     """Clean extracted text by removing extra spaces around punctuation."""
-    # Replace tabs with spaces
-    text = text.replace('\t', ' ')
-    # Remove space after opening quotes (but not newlines)
-    text = re.sub(r'(["„‟]) +', r'\1', text)
-    # Remove space before punctuation
-    text = re.sub(r' +([.,;:!?])', r'\1', text)
-    # Normalize multiple spaces
-    text = re.sub(r' +', ' ', text)
-    # Remove leading spaces on lines
-    text = re.sub(r'\n +', '\n', text)
-    return text.strip()
+    return _collapse_spaces(text).strip()
 
 
 def html_to_markdown(element) -> str:
@@ -69,14 +85,8 @@ def html_to_markdown(element) -> str:
         else:
             parts.append(child.get_text())
 
-    text = "".join(parts)
     # Clean up but preserve newlines
-    text = text.replace('\t', ' ')               # tabs to spaces
-    text = re.sub(r'(["„‟]) +', r'\1', text)   # space after opening quote
-    text = re.sub(r' +([.,;:!?])', r'\1', text)  # space before punctuation
-    text = re.sub(r' +', ' ', text)              # multiple spaces
-    text = re.sub(r'\n +', '\n', text)           # leading spaces on lines
-    return text
+    return _collapse_spaces("".join(parts))
 
 
 def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
@@ -95,8 +105,8 @@ def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
     if title_tag:
         title = title_tag.get_text(strip=True)
         # Remove common prefixes: [#uN], emojis, question marks, etc.
-        title = re.sub(r'^\[#uN]\s*', '', title)
-        title = re.sub(r'^[🌀?\s]+', '', title)
+        title = _TITLE_TAG_PREFIX_RE.sub('', title)
+        title = _TITLE_EMOJI_PREFIX_RE.sub('', title)
         title = title.strip()
 
     # Extract date from og:image URL (e.g., https://img.unknow.news/og/20260123.png)
@@ -104,7 +114,7 @@ def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
     og_image = soup.find("meta", property="og:image")
     if og_image:
         img_url = og_image.get("content", "")
-        date_match = re.search(r'/og/(\d{8})\.png', img_url)
+        date_match = _OG_IMAGE_DATE_RE.search(img_url)
         if date_match:
             d = date_match.group(1)
             date = f"{d[:4]}-{d[4:6]}-{d[6:8]}"
@@ -128,7 +138,7 @@ def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
     if sponsor_div:
         sponsor = html_to_markdown(sponsor_div)
         # Normalize multiple newlines
-        sponsor = re.sub(r'\n\s*\n', '\n\n', sponsor).strip()
+        sponsor = _BLANK_LINES_RE.sub('\n\n', sponsor).strip()
 
     # Collect description paragraphs (between greeting and sponsor marker)
     # Elements are in reverse order: closest to <ol> first, greeting last
@@ -177,19 +187,19 @@ def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
         for span in li.find_all("span"):
             text = span.get_text(strip=True)
             if text.startswith("INFO:"):
-                desc_text = re.sub(r"^INFO:\s*", "", span.get_text(separator=" ", strip=True))
+                desc_text = _INFO_PREFIX_RE.sub("", span.get_text(separator=" ", strip=True))
                 break
 
         # Old format: INFO: is plain text in the li/p element
         if not desc_text:
             li_text = li.get_text(separator=" ", strip=True)
-            info_match = re.search(r"INFO:\s*(.+)$", li_text)
+            info_match = _INFO_TEXT_RE.search(li_text)
             if info_match:
                 desc_text = info_match.group(1)
 
         if title_elem and link_elem:
             # Remove number prefix like "1. ", "12. " etc.
-            link_title = re.sub(r"^\d+\.\s*", "", title_elem.get_text(separator=" ", strip=True))
+            link_title = _NUMBER_PREFIX_RE.sub("", title_elem.get_text(separator=" ", strip=True))
             link_href = link_elem.get("href", "")
             if link_href.startswith("https://uw7.org/"):
                 link_href = get_premium_url(link_href)
@@ -207,7 +217,7 @@ def scrape_newsletter(url: str) -> tuple[dict, list[dict]]:
             date_elem = li.find(["strong", "b"])
             a = li.find("a")
             if date_elem and a:
-                date_match = re.search(r"\d{4}-\d{2}-\d{2}", date_elem.get_text())
+                date_match = _ISO_DATE_RE.search(date_elem.get_text())
                 if date_match:
                     previous_newsletters.append({
                         "url": a.get("href"),
@@ -0,0 +1,38 @@
+"""Tests for common.display diff helpers."""
+
+import unittest
+
+from common.display import _diff_opcodes
+
+
+def _spans(old: str, new: str) -> list[tuple[str, str, str]]:
+    """Opcodes as (tag, old text, new text) for readable assertions."""
+    return [(tag, old[i1:i2], new[j1:j2]) for tag, i1, i2, j1, j2 in _diff_opcodes(old, new)]
+
+
+class DiffOpcodesTest(unittest.TestCase):
+    def test_in_word_edit_highlights_whole_word(self):
+        self.assertEqual(
+            _spans("Hello world today", "Hello wordl today"),
+            [("equal", "Hello ", "Hello "), ("replace", "world", "wordl"), ("equal", " today", " today")],
+        )
+
+    def test_edit_at_end_of_slug_keeps_word(self):
+        self.assertEqual(
+            _spans("foo-bar", "foo-baz"),
+            [("equal", "foo-", "foo-"), ("replace", "bar", "baz")],
+        )
+
+    def test_word_extended(self):
+        self.assertEqual(
+            _spans("fast web", "faster web"),
+            [("replace", "fast", "faster"), ("equal", " web", " web")],
+        )
+
+    def test_equal_strings(self):
+        self.assertEqual(_spans("same", "same"), [("equal", "same", "same")])
+        self.assertEqual(_diff_opcodes("", ""), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
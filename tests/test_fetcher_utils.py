@@ -0,0 +1,32 @@
+"""Tests for common.fetcher_utils URL classification."""
+
+import unittest
+from unittest import mock
+
+from common import fetcher_utils
+from common.fetcher_utils import is_resource_url
+
+
+class IsResourceUrlTest(unittest.TestCase):
+    def test_icon_files(self):
+        self.assertTrue(is_resource_url("https://example.com/favicon.ico"))
+        self.assertTrue(is_resource_url("https://example.com/static/favicon-32x32.png"))
+        self.assertTrue(is_resource_url("https://example.com/robots.txt"))
+
+    def test_articles_mentioning_favicon(self):
+        self.assertFalse(is_resource_url("https://example.com/blog/favicons-explained"))
+        self.assertFalse(is_resource_url("https://css-tricks.com/favicon-quiz/"))
+
+    def test_js_repository_page_served_as_html(self):
+        head = {"status": 200, "content_type": "text/html", "is_html": True, "fetchable": True}
+        with mock.patch.object(fetcher_utils, "check_url_head", return_value=head):
+            self.assertFalse(is_resource_url("https://github.com/mrdoob/three.js"))
+
+    def test_js_file(self):
+        head = {"status": 200, "content_type": "application/javascript", "is_html": False, "fetchable": True}
+        with mock.patch.object(fetcher_utils, "check_url_head", return_value=head):
+            self.assertTrue(is_resource_url("https://cdn.example.com/app.js"))
+
+
+if __name__ == "__main__":
+    unittest.main()
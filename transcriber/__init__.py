@@ -1,6 +1,6 @@
 """Video and audio transcription module."""
 
 from .video_fetcher import fetch_video_content
-from .transcript import extract_transcript_from_info
+from .transcript import extract_transcript_from_info, list_transcripts
 
-__all__ = ["fetch_video_content", "extract_transcript_from_info"]
+__all__ = ["fetch_video_content", "extract_transcript_from_info", "list_transcripts"]
@@ -1,24 +1,129 @@
 """Transcript extraction using youtube-transcript-api."""
 
+import atexit
+import random
+import re
+import time
+from functools import lru_cache
 from typing import Optional, Dict
 
-from youtube_transcript_api import YouTubeTranscriptApi
-from youtube_transcript_api._errors import (
-    TranscriptsDisabled, NoTranscriptFound,
-    RequestBlocked, IpBlocked,
-)
-from youtube_transcript_api.formatters import TextFormatter
+import requests
+from requests.adapters import HTTPAdapter
 
+from common.cache import get_cache, set_cache
 from common.fetcher_utils import truncate_content, RateLimitError
 from common.display import console
 
 # Content truncation limits
 TRANSCRIPT_MAX_CHARS = 128_000
+# Raw transcript kept for paragraph reformatting; the slack covers whitespace
+# the reformatting collapses, so the final cut still lands on a sentence end
+TRANSCRIPT_RAW_MAX_CHARS = int(TRANSCRIPT_MAX_CHARS * 1.2)
 # Language preference for subtitle extraction
 TRANSCRIPT_LANG_PRIORITY = ['en', 'pl']
 
+# One API instance over a pooled session: keep-alive connections to youtube.com
+# are reused across videos instead of a new TLS handshake per transcript.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=20))
+atexit.register(_SESSION.close)
 
-def extract_transcript_from_info(info_dict: Dict, verbose: int = 0) -> Optional[str]:
+# Line breaks (with surrounding whitespace) after a sentence end become paragraph
+# breaks; any other line break is joined with a space
+_SENTENCE_BREAK_RE = re.compile(r"(?<=\.)\s*\n\s*")
+_LINE_BREAK_RE = re.compile(r"(?<![.\s])\s*\n\s*")
+
+# Retries when YouTube blocks a transcript request: waits ~1s, 2s, 4s (+ jitter)
+TRANSCRIPT_MAX_ATTEMPTS = 4
+
+# Videos known to have no usable transcript (disabled, unavailable, none in our
+# languages). Kept shorter than video_fetcher's TRANSCRIPT_RETRY_DAYS so a
+# scheduled retry of a recent video still reaches YouTube.
+NO_TRANSCRIPT_CACHE_TYPE = "no_transcript"
+NO_TRANSCRIPT_CACHE_TTL_DAYS = 0.5
+
+
+@lru_cache(maxsize=1)
+def _get_ytt_api():
+    """Create the shared transcript API on first use.
+
+    youtube_transcript_api is imported here rather than at module level, so
+    runs that never touch a video don't pay for loading it.
+    """
+    from youtube_transcript_api import YouTubeTranscriptApi
+    return YouTubeTranscriptApi(http_client=_SESSION)
+
+
+def _has_no_transcript(video_id: str) -> bool:
+    """Check whether video_id was recently found to have no transcript."""
+    return get_cache(video_id, NO_TRANSCRIPT_CACHE_TYPE, max_age_days=NO_TRANSCRIPT_CACHE_TTL_DAYS) is not None
+
+
+def _remember_no_transcript(video_id: str, reason: str) -> None:
+    """Cache a negative result (error class name) for video_id."""
+    set_cache(video_id, reason, NO_TRANSCRIPT_CACHE_TYPE, ttl_days=NO_TRANSCRIPT_CACHE_TTL_DAYS)
+
+
+def list_transcripts(video_id: str, verbose: int = 0):
+    """List the transcripts available for a video, ahead of extracting one.
+
+    Listing is the slow part of a transcript fetch and doesn't depend on the
+    preferred language, so callers can run it alongside the yt-dlp metadata
+    fetch and pass the result to extract_transcript_from_info().
+
+    Videos with transcripts disabled or unavailable are cached as a negative
+    entry, so neither this nor extract_transcript_from_info() asks again.
+
+    Returns:
+        TranscriptList, or None when there is none (cached) or on a transient
+        failure (not cached: extract_transcript_from_info() then lists again,
+        with retries and error reporting)
+    """
+    from youtube_transcript_api._errors import TranscriptsDisabled, VideoUnavailable, InvalidVideoId
+
+    if _has_no_transcript(video_id):
+        return None
+    try:
+        return _get_ytt_api().list(video_id)
+    except (TranscriptsDisabled, VideoUnavailable, InvalidVideoId) as e:
+        _remember_no_transcript(video_id, type(e).__name__)
+        if verbose:
+            console.print(f"[dim]  No transcripts for {video_id}: {type(e).__name__}[/dim]")
+        return None
+    except Exception as e:
+        if verbose:
+            console.print(f"[dim]  Listing transcripts for {video_id} failed: {type(e).__name__}[/dim]")
+        return None
+
+
+def _fetch_with_backoff(video_id: str, langs: list[str], verbose: int = 0, transcript_list=None):
+    """Fetch a transcript, retrying with jittered exponential backoff when blocked.
+
+    Args:
+        transcript_list: Already listed transcripts for video_id (skips listing)
+
+    Raises:
+        RequestBlocked / IpBlocked: When still blocked after the last attempt
+    """
+    from youtube_transcript_api._errors import RequestBlocked, IpBlocked
+
+    ytt_api = _get_ytt_api()
+    for attempt in range(TRANSCRIPT_MAX_ATTEMPTS):
+        try:
+            # Same as ytt_api.fetch(), but a successful listing isn't repeated on retry
+            if transcript_list is None:
+                transcript_list = ytt_api.list(video_id)
+            return transcript_list.find_transcript(langs).fetch()
+        except (RequestBlocked, IpBlocked):
+            if attempt == TRANSCRIPT_MAX_ATTEMPTS - 1:
+                raise
+            wait_time = 2 ** attempt + random.random()
+            if verbose:
+                console.print(f"[dim]  Transcript request blocked, retrying in {wait_time:.1f}s...[/dim]")
+            time.sleep(wait_time)
+
+
+def extract_transcript_from_info(info_dict: Dict, verbose: int = 0, transcript_list=None) -> Optional[str]:
     """
     Extract transcript using youtube-transcript-api.
 
@@ -28,6 +133,7 @@ def extract_transcript_from_info(info_dict: Dict, verbose: int = 0) -> Optional[
     Args:
         info_dict: yt-dlp info dictionary (needs 'id' and optionally 'language')
         verbose: If True, show detailed extraction info
+        transcript_list: Optional list_transcripts() result for this video (saves a request)
 
     Returns:
         Transcript text (truncated to limit) or None
@@ -39,6 +145,16 @@ def extract_transcript_from_info(info_dict: Dict, verbose: int = 0) -> Optional[
     if not video_id:
         return None
 
+    from youtube_transcript_api._errors import (
+        TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, InvalidVideoId,
+        RequestBlocked, IpBlocked,
+    )
+
+    if _has_no_transcript(video_id):
+        if verbose:
+            console.print("[dim]  No transcript available (cached)[/dim]")
+        return None
+
     langs = []
     original_lang = info_dict.get('language')
     if original_lang and original_lang not in TRANSCRIPT_LANG_PRIORITY:
@@ -48,39 +164,39 @@ def extract_transcript_from_info(info_dict: Dict, verbose: int = 0) -> Optional[
     if verbose:
         console.print(f"[dim]  Fetching transcript for {video_id}, languages: {' -> '.join(langs)}[/dim]")
 
-    ytt_api = YouTubeTranscriptApi()
     try:
-        transcript = ytt_api.fetch(video_id, languages=langs)
-        text = TextFormatter().format_transcript(transcript)
+        if getattr(transcript_list, 'video_id', None) != video_id:
+            transcript_list = None
+        transcript = _fetch_with_backoff(video_id, langs, verbose, transcript_list)
+        # Long videos can have MBs of transcript: join (like TextFormatter) only
+        # the snippets that fit the raw limit, and drop the tail before reformatting
+        parts = []
+        joined_len = -1
+        pre_truncated = False
+        for snippet in transcript:
+            if joined_len >= TRANSCRIPT_RAW_MAX_CHARS:
+                pre_truncated = True
+                break
+            parts.append(snippet.text)
+            joined_len += len(snippet.text) + 1
+        text = "\n".join(parts)
         if not text:
             return None
 
+        if len(text) > TRANSCRIPT_RAW_MAX_CHARS:
+            pre_truncated = True
+            text = text[:TRANSCRIPT_RAW_MAX_CHARS]
+
         # Join lines into paragraphs: keep sentence boundaries (lines ending with .)
-        lines = text.split('\n')
-        paragraphs = []
-        current_paragraph = []
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            current_paragraph.append(line)
-            if line.endswith('.'):
-                paragraphs.append(' '.join(current_paragraph).strip())
-                current_paragraph = []
-
-        # Add any remaining text
-        if current_paragraph:
-            paragraphs.append(' '.join(current_paragraph))
-
-        text = '\n'.join(paragraphs)
+        text = _LINE_BREAK_RE.sub(" ", _SENTENCE_BREAK_RE.sub("\n", text.strip()))
         text, was_truncated = truncate_content(text, TRANSCRIPT_MAX_CHARS)
-        if was_truncated:
+        if was_truncated or pre_truncated:
             console.print("[dim]  i Transcript truncated[/dim]")
         return text
     except (RequestBlocked, IpBlocked):
         raise RateLimitError(f"Rate limited fetching transcript for {video_id}")
-    except (TranscriptsDisabled, NoTranscriptFound):
+    except (TranscriptsDisabled, NoTranscriptFound, VideoUnavailable, InvalidVideoId) as e:
+        _remember_no_transcript(video_id, type(e).__name__)
         if verbose:
             console.print("[dim]  No transcript available[/dim]")
         return None
@@ -1,13 +1,108 @@
 """Video content fetching using yt-dlp and youtube-transcript-api."""
 
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional, Dict, Any
 
-import yt_dlp
-
-from common.fetcher_utils import format_duration, format_duration_short, RateLimitError
+from common.fetcher_utils import (
+    format_duration, format_duration_short, is_video_url, extract_youtube_id, RateLimitError,
+)
 from common.display import console
 from . import yt_dlp_cache
-from .transcript import extract_transcript_from_info
+from .transcript import extract_transcript_from_info, list_transcripts
+
+# yt-dlp options. Only metadata is used (transcripts come from youtube-transcript-api),
+# so format/subtitle probing is skipped: manifests, translated subtitle lists
+# and the player JS download that deciphers format URLs
+_YDL_OPTS = {
+    'quiet': True,
+    'no_warnings': True,
+    'extract_flat': False,
+    'skip_download': True,
+    'socket_timeout': 30,
+    'writesubtitles': False,
+    'writeautomaticsub': False,
+    'ignore_no_formats_error': True,
+    'extractor_args': {
+        'youtube': {
+            'skip': ['hls', 'dash', 'translated_subs'],
+            'player_skip': ['js'],
+        },
+    },
+}
+
+# YoutubeDL instances are reused (see _get_ydl()), one per thread
+_ydl_local = threading.local()
+
+# Fetches in progress, by cache key: a concurrent caller for the same URL waits for
+# the running fetch instead of repeating its yt-dlp and transcript requests
+_inflight: dict[str, Future] = {}
+_inflight_lock = threading.Lock()
+
+# Marker returned by _extract_transcript() when YouTube blocked the request
+_RATE_LIMITED = object()
+
+# yt-dlp info fields kept in the cache (the full info dict is huge)
+_KEEP_KEYS = (
+    'title', 'description', 'duration', 'uploader', 'channel', 'upload_date', 'language',
+    'chapters', 'id', 'view_count', 'like_count', 'categories', 'tags',
+)
+
+# A missing transcript may be transient (false NoTranscriptFound, network blip,
+# captions not generated yet), so cached info of a recent YouTube video without
+# one retries it once this old; metadata keeps its TTL
+TRANSCRIPT_RETRY_DAYS = 1
+# Videos uploaded longer ago than this won't grow a transcript: never retried
+TRANSCRIPT_RETRY_MAX_VIDEO_AGE_DAYS = 30
+
+
+def _is_recent_upload(info: Dict) -> bool:
+    """Check whether the video was uploaded within TRANSCRIPT_RETRY_MAX_VIDEO_AGE_DAYS."""
+    try:
+        uploaded = datetime.strptime(info.get('upload_date') or '', '%Y%m%d')
+    except ValueError:
+        return False
+    return datetime.now() - uploaded <= timedelta(days=TRANSCRIPT_RETRY_MAX_VIDEO_AGE_DAYS)
+
+
+def _should_retry_transcript(url: str, cached_data: Dict) -> bool:
+    """Check whether a cached entry's transcript should be fetched again.
+
+    Only YouTube has transcripts to fetch, so other platforms never retry.
+    """
+    if not extract_youtube_id(url):
+        return False
+    if cached_data.get('_transcript_rate_limited'):
+        # Last attempt was blocked, not "no transcript"
+        return True
+    if cached_data.get('_cached_transcript') is not None or not _is_recent_upload(cached_data):
+        return False
+    checked_at = cached_data.get('_transcript_checked_at')
+    if not checked_at:
+        # Cached before the check time was recorded
+        return True
+    try:
+        return datetime.now() - datetime.fromisoformat(checked_at) > timedelta(days=TRANSCRIPT_RETRY_DAYS)
+    except ValueError:
+        return True
+
+
+def _get_ydl():
+    """Return this thread's YoutubeDL, creating it on first use.
+
+    Creating one loads the extractor list and sets up its HTTP handlers, so it
+    is reused across fetches. YoutubeDL isn't thread-safe; one per thread keeps
+    concurrent fetches (TUI workers) parallel instead of queueing them behind
+    a shared instance.
+    yt-dlp itself is imported here: loading it is slow and cache hits don't need it.
+    """
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None:
+        import yt_dlp
+        ydl = _ydl_local.ydl = yt_dlp.YoutubeDL(_YDL_OPTS)
+    return ydl
 
 
 def _fetch_from_cache(url: str, force: bool, verbose: int = 0) -> Optional[tuple]:
@@ -33,6 +128,8 @@ def _fetch_from_cache(url: str, force: bool, verbose: int = 0) -> Optional[tuple
         console.print(f"[dim]  Tags: {len(tags)}[/dim]")
 
     transcript = cached_data.get('_cached_transcript')
+    if _should_retry_transcript(url, cached_data):
+        transcript = _cache_info(url, cached_data, _extract_transcript(cached_data, verbose), refresh=True)
     return cached_data, transcript
 
 
@@ -42,16 +139,16 @@ def _fetch_with_yt_dlp(url: str, verbose: int = 0) -> Optional[tuple]:
     Returns:
         Tuple of (filtered_info, transcript) or None on failure.
     """
-    ydl_opts: yt_dlp._Params = {
-        'quiet': True,
-        'no_warnings': True,
-        'extract_flat': False,
-        'skip_download': True,
-        'socket_timeout': 30,
-    }
+    # Listing YouTube transcripts only needs the video ID: run it while yt-dlp
+    # fetches the metadata, which decides the preferred transcript language
+    video_id = extract_youtube_id(url)
+    listing = None
+    if video_id:
+        executor = ThreadPoolExecutor(max_workers=1)
+        listing = executor.submit(list_transcripts, video_id, verbose)
+        executor.shutdown(wait=False)
 
-    with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        info = ydl.extract_info(url, download=False)
+    info = _get_ydl().extract_info(url, download=False)
 
     if not info:
         return None
@@ -60,22 +157,12 @@ def _fetch_with_yt_dlp(url: str, verbose: int = 0) -> Optional[tuple]:
         video_id = info.get('id', 'unknown')
         console.print(f"[dim]  yt-dlp: extracted info for {video_id}[/dim]")
 
-    # Filter to essential data only before caching
-    filtered_info = {
-        'title': info.get('title'),
-        'description': info.get('description'),
-        'duration': info.get('duration'),
-        'uploader': info.get('uploader'),
-        'channel': info.get('channel'),
-        'upload_date': info.get('upload_date'),
-        'language': info.get('language'),
-        'chapters': info.get('chapters'),
-        'id': info.get('id'),
-        'view_count': info.get('view_count'),
-        'like_count': info.get('like_count'),
-        'categories': info.get('categories'),
-        'tags': info.get('tags'),
-    }
+    # Filter to essential data only before caching (missing fields are left
+    # out; every reader uses .get())
+    filtered_info = {key: info[key] for key in _KEEP_KEYS if info.get(key) is not None}
+    # The raw info (formats, thumbnails, subtitle maps) can be tens of MB: don't
+    # keep it alive while the transcript is fetched
+    del info
 
     if verbose:
         chapters = filtered_info.get('chapters') or []
@@ -83,22 +170,50 @@ def _fetch_with_yt_dlp(url: str, verbose: int = 0) -> Optional[tuple]:
         console.print(f"[dim]  Chapters: {len(chapters)}[/dim]")
         console.print(f"[dim]  Tags: {len(tags)}[/dim]")
 
-    # Extract transcript
-    transcript = None
+    transcript_list = listing.result() if listing else None
+    transcript = _cache_info(url, filtered_info, _extract_transcript(filtered_info, verbose, transcript_list))
+
+    return filtered_info, transcript
+
+
+def _extract_transcript(info: Dict, verbose: int = 0, transcript_list=None):
+    """Extract the transcript; returns _RATE_LIMITED instead of raising when YouTube blocks us."""
     try:
-        transcript = extract_transcript_from_info(filtered_info, verbose=verbose)
+        transcript = extract_transcript_from_info(info, verbose=verbose, transcript_list=transcript_list)
         if transcript:
             console.print(f"[dim]  i Transcript extracted ({len(transcript)} chars)[/dim]")
+        return transcript
     except RateLimitError as e:
         console.print(f"[yellow]  Warning: Rate limit error: {e}[/yellow]")
         console.print("[dim]  Wait before retrying, or reduce request rate[/dim]")
         console.print("[dim]  Continuing without transcript...[/dim]")
+        return _RATE_LIMITED
 
-    # Cache filtered data WITH transcript
-    filtered_info['_cached_transcript'] = transcript
-    yt_dlp_cache.set_cached(url, filtered_info)
 
-    return filtered_info, transcript
+def _cache_info(url: str, info: Dict, transcript, refresh: bool = False) -> Optional[str]:
+    """Cache video info WITH transcript (stored into info in place).
+
+    A rate-limited transcript is stored as None plus a flag, so the next
+    fetch retries it instead of treating the video as having no transcript.
+    The attempt time is stored too, so a missing transcript of a recent
+    YouTube video is retried after TRANSCRIPT_RETRY_DAYS.
+
+    Args:
+        refresh: info came from the cache; update its transcript fields in place
+            so the retry doesn't extend the metadata's TTL
+
+    Returns:
+        The transcript as cached (None when rate limited)
+    """
+    rate_limited = transcript is _RATE_LIMITED
+    info['_transcript_rate_limited'] = rate_limited
+    info['_cached_transcript'] = None if rate_limited else transcript
+    info['_transcript_checked_at'] = datetime.now().isoformat()
+    if refresh:
+        yt_dlp_cache.update_cached(url, info)
+    else:
+        yt_dlp_cache.set_cached(url, info)
+    return info['_cached_transcript']
 
 
 def _build_video_result(info: Dict, transcript: Optional[str]) -> Dict[str, Any]:
@@ -132,17 +247,49 @@ def fetch_video_content(url: str, verbose: int = 0, force: bool = False) -> Opti
     """
     Fetch video metadata and transcript using yt-dlp.
 
+    Concurrent calls for the same URL share a single fetch.
+
     Args:
         url: Video URL
         verbose: Verbosity level
         force: Bypass cache
 
     Returns:
-        Dict with video data or None on failure
+        Dict with video data or None on failure (or when url isn't on a known video platform)
 
     Raises:
         RateLimitError: When YouTube blocks the transcript request
     """
+    # Don't spin up yt-dlp's extractor matching for URLs it has nothing to do with
+    if not is_video_url(url):
+        return None
+
+    # Keyed like the cache, so youtu.be and youtube.com links to one video share a fetch
+    key = yt_dlp_cache.cache_key(url)
+    with _inflight_lock:
+        running = _inflight.get(key)
+        if running is None:
+            future = _inflight[key] = Future()
+    if running is not None:
+        # Same video is being fetched by another thread: share its result
+        # (a copy, so callers can't see each other's changes) or its error
+        return copy.deepcopy(running.result())
+
+    try:
+        result = _fetch_video_content(url, verbose, force)
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _fetch_video_content(url: str, verbose: int, force: bool) -> Optional[Dict[str, Any]]:
+    """fetch_video_content() without the in-flight deduplication."""
     try:
         # Try cache first
         cached = _fetch_from_cache(url, force, verbose)
@@ -5,12 +5,23 @@ Caches full yt-dlp info_dict to avoid hitting YouTube rate limits.
 """
 
 from typing import Optional, Dict, Any
-from common.cache import get_cache, set_cache, remove_cache
+from common.cache import get_cache, set_cache, update_cache_value, remove_cache, remove_cache_many
+from common.fetcher_utils import extract_youtube_id
 
 CACHE_TYPE = "yt_dlp"
 CACHE_TTL_DAYS = 180  # Video metadata rarely changes
 
 
+def cache_key(url: str) -> str:
+    """Return the cache key for a video URL.
+
+    All URL shapes of one YouTube video (youtu.be, m., &t=30s, ...) map to
+    https://www.youtube.com/watch?v=<id>; other URLs are used as-is.
+    """
+    video_id = extract_youtube_id(url)
+    return f"https://www.youtube.com/watch?v={video_id}" if video_id else url
+
+
 def get_cached(url: str) -> Optional[Dict[str, Any]]:
     """Get cached yt-dlp info for a URL.
 
@@ -20,7 +31,12 @@ def get_cached(url: str) -> Optional[Dict[str, Any]]:
     Returns:
         Cached yt-dlp info dict or None
     """
-    return get_cache(url, CACHE_TYPE, max_age_days=CACHE_TTL_DAYS)
+    key = cache_key(url)
+    cached = get_cache(key, CACHE_TYPE, max_age_days=CACHE_TTL_DAYS)
+    if cached is None and key != url:
+        # Entries cached before keys were canonicalized
+        cached = get_cache(url, CACHE_TYPE, max_age_days=CACHE_TTL_DAYS)
+    return cached
 
 
 def set_cached(url: str, info_dict: Dict[str, Any]) -> None:
@@ -30,7 +46,20 @@ def set_cached(url: str, info_dict: Dict[str, Any]) -> None:
         url: Video URL key
         info_dict: yt-dlp info dictionary to cache
     """
-    set_cache(url, info_dict, CACHE_TYPE, ttl_days=CACHE_TTL_DAYS)
+    set_cache(cache_key(url), info_dict, CACHE_TYPE, ttl_days=CACHE_TTL_DAYS)
+
+
+def update_cached(url: str, info_dict: Dict[str, Any]) -> None:
+    """Update cached yt-dlp info for a URL without extending its TTL.
+
+    Args:
+        url: Video URL key
+        info_dict: yt-dlp info dictionary to store
+    """
+    key = cache_key(url)
+    if not update_cache_value(key, info_dict, CACHE_TYPE) and key != url:
+        # Entries cached before keys were canonicalized
+        update_cache_value(url, info_dict, CACHE_TYPE)
 
 
 def remove_cached(url: str) -> None:
@@ -39,4 +68,8 @@ def remove_cached(url: str) -> None:
   Args:
       url: URL to remove from cache
   """
-  remove_cache(url, CACHE_TYPE)
+  key = cache_key(url)
+  if key == url:
+    remove_cache(url, CACHE_TYPE)
+  else:
+    remove_cache_many([key, url], CACHE_TYPE)